@@ -6,6 +6,8 @@ Phases: RESEARCH → TESTS → EXECUTION → REPORT
 """
 
 import json
+import os
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
@@ -14,8 +16,79 @@ from typing import Any
 
 from .utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional: pip install 24h-testers[fast]
+    orjson = None
+
 logger = get_logger("checkpoint")
 
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601 with millisecond precision."""
+    return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize checkpoint data as indented UTF-8 JSON."""
+    if orjson is not None:
+        # Stringify non-str metadata keys the way json.dumps does
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse checkpoint JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    # Without kwargs json.loads already reuses json's shared default decoder
+    return json.loads(raw)
+
+
+def _is_research_file(name: str) -> bool:
+    return name.endswith(".md")
+
+
+# Equivalent of the globs *_test.py, *_test.js, *.test.js, *_test.rs, test_*.py
+_TEST_SUFFIXES = ("_test.py", "_test.js", ".test.js", "_test.rs")
+_TEST_PREFIX = "test_"
+
+
+def _is_test_file(name: str) -> bool:
+    return name.endswith(_TEST_SUFFIXES) or (
+        name.startswith(_TEST_PREFIX) and name.endswith(".py")
+    )
+
+
+def _is_result_file(name: str) -> bool:
+    return name == "results.json" or name.endswith("_results.json")
+
+
+def _is_json_file(name: str) -> bool:
+    return name.endswith(".json")
+
+
+def _matching_names(path: str | os.PathLike, match: Callable[[str], bool]) -> list[str]:
+    """Names of entries in directory path that satisfy match, from one scandir."""
+    try:
+        with os.scandir(path) as it:
+            return [entry.name for entry in it if match(entry.name)]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _dir_has(path: str | os.PathLike, match: Callable[[str], bool]) -> bool:
+    """True if any entry name in directory path satisfies match."""
+    try:
+        with os.scandir(path) as it:
+            return any(match(entry.name) for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
 
 class Phase(str, Enum):
     """Processing phases for an item."""
@@ -29,52 +102,49 @@ class Phase(str, Enum):
     @classmethod
     def next_phase(cls, current: "Phase") -> "Phase | None":
         """Get the next phase after current."""
-        order = [cls.INIT, cls.RESEARCH, cls.TESTS, cls.EXECUTION, cls.REPORT, cls.COMPLETE]
-        try:
-            idx = order.index(current)
-            if idx < len(order) - 1:
-                return order[idx + 1]
-        except ValueError:
-            pass
-        return None
+        return _NEXT_PHASE.get(current)
 
     @classmethod
-    def from_artifacts(cls, run_dir: Path) -> "Phase":
+    def from_artifacts(cls, run_dir: str | Path) -> "Phase":
         """Detect current phase from existing artifacts."""
-        if not run_dir.exists():
+        # One listing of run_dir; subdirectories are only read when present,
+        # latest phase first, stopping at the first matching file.
+        try:
+            with os.scandir(run_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
             return cls.INIT
 
         # Check for FINAL_REPORT.md
-        final_report = run_dir / "FINAL_REPORT.md"
-        if final_report.exists() and final_report.stat().st_size > 100:
+        final_report = entries.get("FINAL_REPORT.md")
+        if final_report is not None and final_report.stat().st_size > 100:
             return cls.COMPLETE
 
         # Check for results
-        results_dir = run_dir / "results"
-        if results_dir.exists():
-            result_files = list(results_dir.glob("*_results.json")) + list(results_dir.glob("results.json"))
-            if result_files:
-                return cls.REPORT  # Ready to generate report
+        if "results" in entries and _dir_has(entries["results"], _is_result_file):
+            return cls.REPORT  # Ready to generate report
 
         # Check for test files
-        tests_dir = run_dir / "tests"
-        if tests_dir.exists():
-            test_files = list(tests_dir.glob("*_test.py")) + list(tests_dir.glob("test_*.py"))
-            test_files += list(tests_dir.glob("*_test.js")) + list(tests_dir.glob("*.test.js"))
-            test_files += list(tests_dir.glob("*_test.rs"))
-            if test_files:
-                return cls.EXECUTION  # Ready to execute tests
+        if "tests" in entries and _dir_has(entries["tests"], _is_test_file):
+            return cls.EXECUTION  # Ready to execute tests
 
         # Check for research
-        research_dir = run_dir / "research"
-        if research_dir.exists():
-            research_files = list(research_dir.glob("*.md"))
-            if research_files:
-                return cls.TESTS  # Ready to create tests
+        if "research" in entries and _dir_has(entries["research"], _is_research_file):
+            return cls.TESTS  # Ready to create tests
 
         return cls.INIT
 
 
+_NEXT_PHASE: dict[Phase, Phase | None] = {
+    Phase.INIT: Phase.RESEARCH,
+    Phase.RESEARCH: Phase.TESTS,
+    Phase.TESTS: Phase.EXECUTION,
+    Phase.EXECUTION: Phase.REPORT,
+    Phase.REPORT: Phase.COMPLETE,
+    Phase.COMPLETE: None,
+}
+
+
 @dataclass
 class Checkpoint:
     """Checkpoint state for an item run."""
@@ -90,8 +160,8 @@ class Checkpoint:
 
     def __post_init__(self):
         if not self.started_at:
-            self.started_at = datetime.now(timezone.utc).isoformat()
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+            self.started_at = _now_iso()
+        self.updated_at = _now_iso()
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -111,22 +181,22 @@ class Checkpoint:
         next_phase = Phase.next_phase(self.phase)
         if next_phase:
             self.phase = next_phase
-            self.updated_at = datetime.now(timezone.utc).isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
 
     def add_artifact(self, phase: str, path: str) -> None:
         """Record an artifact created in a phase."""
-        if phase not in self.artifacts:
-            self.artifacts[phase] = []
-        if path not in self.artifacts[phase]:
-            self.artifacts[phase].append(path)
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        paths = self.artifacts.setdefault(phase, [])
+        if path not in paths:
+            paths.append(path)
+        self.updated_at = _now_iso()
 
     def add_error(self, error: str) -> None:
         """Record an error."""
-        self.errors.append(f"[{datetime.now(timezone.utc).isoformat()}] {error}")
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        now = _now_iso()
+        self.errors.append(f"[{now}] {error}")
+        self.updated_at = now
 
 
 class CheckpointManager:
@@ -134,20 +204,33 @@ class CheckpointManager:
 
     CHECKPOINT_FILE = ".checkpoint.json"
 
-    def __init__(self, runs_dir: Path):
+    def __init__(self, runs_dir: Path, cache_resume: bool = False):
         self.runs_dir = Path(runs_dir)
-
-    def get_checkpoint_path(self, run_dir: Path) -> Path:
+        # Optional memo of can_resume() keyed by (run_dir, item_id). Artifacts
+        # written outside this manager are not seen until invalidate().
+        self.cache_resume = cache_resume
+        self._resume_cache: dict[tuple[str, str], bool] = {}
+
+    def invalidate(self, run_dir: str | Path | None = None) -> None:
+        """Drop cached can_resume() results for one run directory, or all."""
+        if run_dir is None:
+            self._resume_cache.clear()
+            return
+        key_dir = str(run_dir)
+        for key in [k for k in self._resume_cache if k[0] == key_dir]:
+            del self._resume_cache[key]
+
+    def get_checkpoint_path(self, run_dir: str | Path) -> Path:
         """Get checkpoint file path for a run directory."""
         return Path(run_dir) / self.CHECKPOINT_FILE
 
-    def load(self, run_dir: Path, item_id: str) -> Checkpoint:
+    def load(self, run_dir: str | Path, item_id: str) -> Checkpoint:
         """Load checkpoint or create new one."""
         checkpoint_path = self.get_checkpoint_path(run_dir)
 
         if checkpoint_path.exists():
             try:
-                data = json.loads(checkpoint_path.read_text())
+                data = _loads(checkpoint_path.read_bytes())
                 checkpoint = Checkpoint.from_dict(data)
                 logger.debug(f"Loaded checkpoint for {item_id}: phase={checkpoint.phase.value}")
                 return checkpoint
@@ -168,11 +251,13 @@ class CheckpointManager:
     def save(self, run_dir: Path, checkpoint: Checkpoint) -> None:
         """Save checkpoint to file."""
         checkpoint_path = self.get_checkpoint_path(run_dir)
-        checkpoint.updated_at = datetime.now(timezone.utc).isoformat()
+        checkpoint.updated_at = _now_iso()
+
+        self.invalidate(run_dir)
 
         try:
             Path(run_dir).mkdir(parents=True, exist_ok=True)
-            checkpoint_path.write_text(json.dumps(checkpoint.to_dict(), indent=2))
+            checkpoint_path.write_bytes(_dumps(checkpoint.to_dict()))
             logger.debug(f"Saved checkpoint for {checkpoint.item_id}: phase={checkpoint.phase.value}")
         except Exception as e:
             logger.error(f"Failed to save checkpoint for {checkpoint.item_id}: {e}")
@@ -180,36 +265,65 @@ class CheckpointManager:
     def delete(self, run_dir: Path) -> None:
         """Delete checkpoint file."""
         checkpoint_path = self.get_checkpoint_path(run_dir)
+        self.invalidate(run_dir)
         if checkpoint_path.exists():
             checkpoint_path.unlink()
 
-    def _scan_artifacts(self, run_dir: Path, checkpoint: Checkpoint) -> None:
+    def _scan_artifacts(self, run_dir: str | Path, checkpoint: Checkpoint) -> None:
         """Scan run directory for existing artifacts."""
-        run_dir = Path(run_dir)
-
-        # Research artifacts
-        research_dir = run_dir / "research"
-        if research_dir.exists():
-            for f in research_dir.glob("*.md"):
-                checkpoint.add_artifact("research", str(f.relative_to(run_dir)))
-
-        # Test artifacts
-        tests_dir = run_dir / "tests"
-        if tests_dir.exists():
-            for pattern in ["*_test.py", "test_*.py", "*_test.js", "*.test.js", "*_test.rs"]:
-                for f in tests_dir.glob(pattern):
-                    checkpoint.add_artifact("tests", str(f.relative_to(run_dir)))
-
-        # Result artifacts
-        results_dir = run_dir / "results"
-        if results_dir.exists():
-            for f in results_dir.glob("*.json"):
-                checkpoint.add_artifact("execution", str(f.relative_to(run_dir)))
-
-    def can_resume(self, run_dir: Path, item_id: str) -> bool:
-        """Check if an item can be resumed from checkpoint."""
+        # (phase, subdirectory, filename predicate); one scandir per subdirectory
+        for phase, subdir, match in (
+            ("research", "research", _is_research_file),
+            ("tests", "tests", _is_test_file),
+            ("execution", "results", _is_json_file),
+        ):
+            names = _matching_names(os.path.join(run_dir, subdir), match)
+            if not names:
+                continue
+            # One set per phase keeps a large scan linear instead of rescanning
+            # the phase's list for every file add_artifact() would check
+            paths = checkpoint.artifacts.setdefault(phase, [])
+            seen = set(paths)
+            for name in names:
+                path = os.path.join(subdir, name)
+                if path not in seen:
+                    seen.add(path)
+                    paths.append(path)
+            checkpoint.updated_at = _now_iso()
+
+    def can_resume(self, run_dir: str | Path, item_id: str) -> bool:
+        """Check if an item can be resumed from checkpoint (run_dir may be a str)."""
+        key = (str(run_dir), item_id)
+        if self.cache_resume and key in self._resume_cache:
+            return self._resume_cache[key]
+
         checkpoint = self.load(run_dir, item_id)
-        return checkpoint.phase not in (Phase.INIT, Phase.COMPLETE)
+        resumable = checkpoint.phase not in (Phase.INIT, Phase.COMPLETE)
+        if self.cache_resume:
+            self._resume_cache[key] = resumable
+        return resumable
+
+    def resumable_item_ids(
+        self, parent_dir: Path, item_ids: Iterable[str] | None = None
+    ) -> frozenset[str]:
+        """
+        Return IDs of items under parent_dir that can be resumed.
+
+        Each item's run directory is parent_dir / item_id. One scandir finds the
+        run directories that exist, so items never started cost no probes.
+        Pass item_ids to restrict the check to those items.
+        """
+        try:
+            with os.scandir(parent_dir) as entries:
+                names = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
+        if item_ids is not None:
+            names.intersection_update(item_ids)
+
+        parent = Path(parent_dir)
+        return frozenset(name for name in names if self.can_resume(parent / name, name))
 
     def get_resume_instructions(self, checkpoint: Checkpoint) -> str:
         """Generate instructions for resuming from checkpoint."""
@@ -259,25 +373,13 @@ def detect_phase_completion(run_dir: Path, phase: Phase) -> bool:
     run_dir = Path(run_dir)
 
     if phase == Phase.RESEARCH:
-        research_dir = run_dir / "research"
-        if research_dir.exists():
-            return bool(list(research_dir.glob("*.md")))
-        return False
+        return _dir_has(run_dir / "research", _is_research_file)
 
     elif phase == Phase.TESTS:
-        tests_dir = run_dir / "tests"
-        if tests_dir.exists():
-            patterns = ["*_test.py", "test_*.py", "*_test.js", "*.test.js", "*_test.rs"]
-            for pattern in patterns:
-                if list(tests_dir.glob(pattern)):
-                    return True
-        return False
+        return _dir_has(run_dir / "tests", _is_test_file)
 
     elif phase == Phase.EXECUTION:
-        results_dir = run_dir / "results"
-        if results_dir.exists():
-            return bool(list(results_dir.glob("*.json")))
-        return False
+        return _dir_has(run_dir / "results", _is_json_file)
 
     elif phase == Phase.REPORT:
         final_report = run_dir / "FINAL_REPORT.md"
@@ -112,6 +112,12 @@ Examples:
         action="store_true",
         help="Enable verbose logging",
     )
+    run_parser.add_argument(
+        "--log-json",
+        type=str,
+        default=None,
+        help="Also append every log record to this file as JSON lines",
+    )
     run_parser.add_argument(
         "--repo-root",
         type=str,
@@ -173,6 +179,7 @@ async def run_processor(args) -> int:
         model=args.model,
         timeout_ms=args.timeout,
         verbose=args.verbose,
+        log_json=Path(args.log_json) if args.log_json else None,
     )
 
     processor = ChecklistProcessor(config)
@@ -360,7 +367,15 @@ def main() -> int:
         # Re-parse with run defaults
         args = parser.parse_args(["run"])
 
-    setup_logging(verbose=getattr(args, "verbose", False))
+    log_json = getattr(args, "log_json", None)
+    if log_json:
+        log_json = Path(log_json)
+        if not log_json.is_absolute():
+            log_json = get_repo_root(args) / log_json
+    setup_logging(
+        verbose=getattr(args, "verbose", False),
+        structured_path=log_json or None,
+    )
 
     if args.command == "run":
         return asyncio.run(run_processor(args))
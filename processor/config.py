@@ -260,6 +260,7 @@ class ProcessorConfig:
 
     # Observability
     verbose: bool = False
+    log_json: Path | None = None  # Structured JSON-lines log file
 
     def __post_init__(self):
         """Validate and resolve paths after initialization."""
@@ -332,6 +333,11 @@ class ProcessorConfig:
             if not self.state_dir.is_absolute():
                 self.state_dir = self.repo_root / self.state_dir
 
+        if self.log_json is not None:
+            self.log_json = Path(self.log_json)
+            if not self.log_json.is_absolute():
+                self.log_json = self.repo_root / self.log_json
+
         # Validate batch size
         if self.batch_size < 1:
             raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
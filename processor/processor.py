@@ -27,7 +27,22 @@ from .config import ProcessorConfig, ProcessingMode
 from .models import AgentRun, AgentStatus, ChecklistItem, ProcessingResult, RunStage
 from .run_manager import RunManager
 from .utils.checklist_parser import ChecklistParser
-from .utils.logger import get_logger, setup_logging
+from .utils.logger import (
+    EVENT_ALL_COMPLETE,
+    EVENT_BATCH_COMPLETE,
+    EVENT_BATCH_STARTED,
+    EVENT_DRY_RUN,
+    EVENT_ITEM_COMPLETED,
+    EVENT_ITEM_FAILED,
+    EVENT_ITEM_STARTED,
+    EVENT_ITERATION_STARTED,
+    EVENT_MAX_ITERATIONS,
+    EVENT_PRIORITIZING,
+    EVENT_PROCESSING_COMPLETE,
+    EVENT_REQUEUED,
+    get_logger,
+    setup_logging,
+)
 
 from .stages import (
     ParseChecklistStage,
@@ -64,7 +79,7 @@ class ChecklistProcessor:
         self.config = config
 
         # Setup logging
-        setup_logging(verbose=config.verbose)
+        setup_logging(verbose=config.verbose, structured_path=config.log_json)
 
         # Ensure directories exist
         config.ensure_directories()
@@ -72,6 +87,9 @@ class ChecklistProcessor:
         # Initialize components
         self.parser = ChecklistParser(config.checklist_path, config.repo_root)
         self.run_manager = RunManager(config.state_dir)
+        # Resume checks are cached across iterations; _process_item invalidates
+        # an item's entry once its agent may have produced new artifacts.
+        self.checkpoint_manager = CheckpointManager(config.runs_dir, cache_resume=True)
 
         # Initialize stages
         self._init_stages()
@@ -114,8 +132,9 @@ class ChecklistProcessor:
             require_final_report=True,  # Strict: must have FINAL_REPORT.md
         )
 
+        # Status writes are queued and flushed once per batch
         self.update_status_stage = UpdateStatusStage(
-            parser=self.parser, runs_dir=self.config.runs_dir
+            parser=self.parser, runs_dir=self.config.runs_dir, defer_writes=True
         )
 
         # Use agent_resources_dir from config (supports override)
@@ -222,34 +241,39 @@ class ChecklistProcessor:
         for subdir in subdirs:
             (run_dir / subdir).mkdir(exist_ok=True)
 
-    def _has_incomplete_checkpoint(
-        self, item: ChecklistItem, prefix_tier_map: dict[str, str]
-    ) -> bool:
-        """Check if an item has an incomplete checkpoint (needs to be resumed)."""
-        if not self.config.enable_checkpoints:
-            return False
-        run_dir = self._get_run_dir(item, prefix_tier_map)
-        checkpoint_manager = CheckpointManager(self.config.runs_dir)
-        return checkpoint_manager.can_resume(run_dir, item.id)
-
     def _prioritize_checkpoint_items(
         self,
         items: list[ChecklistItem],
         prefix_tier_map: dict[str, str],
     ) -> list[ChecklistItem]:
         """Sort items to prioritize those with incomplete checkpoints."""
+        if not self.config.enable_checkpoints:
+            return items
+
+        # Group by tier directory so each is listed with a single scandir
+        ids_by_tier_dir: dict[Path, set[str]] = {}
+        for item in items:
+            tier_dir = self._get_run_dir(item, prefix_tier_map).parent
+            ids_by_tier_dir.setdefault(tier_dir, set()).add(item.id)
+
+        resumable: set[str] = set()
+        for tier_dir, item_ids in ids_by_tier_dir.items():
+            resumable |= self.checkpoint_manager.resumable_item_ids(tier_dir, item_ids)
+
         with_checkpoint = []
         without_checkpoint = []
 
         for item in items:
-            if self._has_incomplete_checkpoint(item, prefix_tier_map):
+            if item.id in resumable:
                 with_checkpoint.append(item)
             else:
                 without_checkpoint.append(item)
 
         if with_checkpoint:
             logger.info(
-                f"Prioritizing {len(with_checkpoint)} items with incomplete checkpoints"
+                "Prioritizing %d items with incomplete checkpoints",
+                len(with_checkpoint),
+                extra={"event": EVENT_PRIORITIZING, "count": len(with_checkpoint)},
             )
 
         return with_checkpoint + without_checkpoint
@@ -271,7 +295,14 @@ class ChecklistProcessor:
         )
 
         logger.info(
-            f"Starting {item.id}", extra={"tier": item.tier, "target": item.target}
+            "Starting %s",
+            item.id,
+            extra={
+                "event": EVENT_ITEM_STARTED,
+                "item_id": item.id,
+                "tier": item.tier,
+                "target": item.target,
+            },
         )
 
         try:
@@ -338,9 +369,15 @@ class ChecklistProcessor:
             if update_result and update_result.status == StageStatus.OK:
                 run.set_status(AgentStatus.COMPLETED)
                 logger.info(
-                    f"Completed {item.id}", extra={"duration_ms": run.get_duration_ms()}
+                    "Completed %s",
+                    item.id,
+                    extra={
+                        "event": EVENT_ITEM_COMPLETED,
+                        "duration_ms": run.get_duration_ms(),
+                    },
                 )
-                return {"success": True, "run": run}
+                queued = (update_result.data or {}).get("status_queued", False)
+                return {"success": True, "run": run, "status_queued": queued}
             else:
                 # Pipeline failed
                 run.set_status(
@@ -372,19 +409,28 @@ class ChecklistProcessor:
                     "checkpoint": True,
                 }
 
-            logger.error(f"Failed {item.id}: {e}", extra={"error_type": error_type})
+            logger.error(
+                "Failed %s: %s",
+                item.id,
+                e,
+                extra={"event": EVENT_ITEM_FAILED, "error_type": error_type},
+            )
             run.set_status(AgentStatus.FAILED, str(e))
 
             # Check if there's a checkpoint to resume from
             has_checkpoint = False
             if self.config.enable_checkpoints and run_dir:
-                checkpoint_manager = CheckpointManager(self.config.runs_dir)
-                has_checkpoint = checkpoint_manager.can_resume(run_dir, item.id)
+                self.checkpoint_manager.invalidate(run_dir)
+                has_checkpoint = self.checkpoint_manager.can_resume(run_dir, item.id)
 
             # Update status - paused if checkpoint exists, failed otherwise
             try:
-                status = "⏸️ Paused" if has_checkpoint else "❌ Failed"
-                await self.parser.update_item_status(item.id, status)
+                status = (
+                    UpdateStatusStage.STATUS_PAUSED
+                    if has_checkpoint
+                    else UpdateStatusStage.STATUS_FAILED
+                )
+                self.parser.queue_status_update(item.id, status)
                 if has_checkpoint:
                     logger.info(f"Item {item.id} paused with checkpoint for resumption")
             except Exception as update_err:
@@ -397,6 +443,10 @@ class ChecklistProcessor:
                 "has_checkpoint": has_checkpoint,
             }
 
+        finally:
+            # The agent may have written artifacts; re-probe on the next iteration
+            self.checkpoint_manager.invalidate(run_dir)
+
     async def process(self) -> ProcessingResult:
         """
         Main entry point - process checklist items.
@@ -428,6 +478,7 @@ class ChecklistProcessor:
                 logger.info(
                     f"Starting iteration {iteration}/{self.config.max_iterations}",
                     extra={
+                        "event": EVENT_ITERATION_STARTED,
                         "iteration": iteration,
                         "max_iterations": self.config.max_iterations,
                         "batch_size": self.config.batch_size,
@@ -448,7 +499,8 @@ class ChecklistProcessor:
 
                 if not remaining:
                     logger.info(
-                        "All checklist items are complete. Nothing more to process."
+                        "All checklist items are complete. Nothing more to process.",
+                        extra={"event": EVENT_ALL_COMPLETE},
                     )
                     break
 
@@ -460,12 +512,21 @@ class ChecklistProcessor:
                 # Select batch
                 batch = prioritized[: self.config.batch_size]
                 logger.info(
-                    f"Processing batch of {len(batch)} items (iteration {iteration})",
-                    extra={"items": [i.id for i in batch]},
+                    "Processing batch of %d items (iteration %d)",
+                    len(batch),
+                    iteration,
+                    extra={
+                        "event": EVENT_BATCH_STARTED,
+                        "items": [i.id for i in batch],
+                    },
                 )
 
                 if self.config.dry_run:
-                    logger.info(f"[DRY RUN] Would process: {[i.id for i in batch]}")
+                    logger.info(
+                        "[DRY RUN] Would process: %s",
+                        [i.id for i in batch],
+                        extra={"event": EVENT_DRY_RUN},
+                    )
                     total_processed += len(batch)
                     continue
 
@@ -476,6 +537,15 @@ class ChecklistProcessor:
                 ]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
 
+                # Write all status changes from this batch in one checklist rewrite
+                flush_error = None
+                try:
+                    await self.update_status_stage.flush_deferred()
+                except Exception as e:
+                    flush_error = e
+                    logger.error(f"Failed to update status: {e}")
+                await self.update_status_stage.flush_events()
+
                 # Summarize batch results
                 batch_completed = 0
                 batch_failed = 0
@@ -489,7 +559,15 @@ class ChecklistProcessor:
                     elif isinstance(result, dict):
                         all_runs.append(result.get("run"))
                         if result.get("success"):
-                            batch_completed += 1
+                            if flush_error is not None and result.get("status_queued"):
+                                # Its Completed status never reached the checklist
+                                batch_failed += 1
+                                result["run"].set_status(
+                                    AgentStatus.FAILED,
+                                    f"Checklist update failed: {flush_error}",
+                                )
+                            else:
+                                batch_completed += 1
                         elif result.get("retry"):
                             # Item should be retried (e.g., timeout with checkpoint)
                             retry_items.append(item)
@@ -504,7 +582,12 @@ class ChecklistProcessor:
                 total_failed += batch_failed
 
                 logger.info(
-                    f"Batch {iteration} complete: {batch_completed} completed, {batch_failed} failed, {len(retry_items)} to retry"
+                    "Batch %d complete: %d completed, %d failed, %d to retry",
+                    iteration,
+                    batch_completed,
+                    batch_failed,
+                    len(retry_items),
+                    extra={"event": EVENT_BATCH_COMPLETE},
                 )
 
                 # Re-queue retry items for next iteration
@@ -524,7 +607,11 @@ class ChecklistProcessor:
                         for item in remaining
                         if item not in batch and item not in retry_items
                     ]
-                    logger.info(f"Re-queued {len(retry_items)} items for retry")
+                    logger.info(
+                        "Re-queued %d items for retry",
+                        len(retry_items),
+                        extra={"event": EVENT_REQUEUED},
+                    )
 
                 # Generate tier reports after each batch
                 items = self.parser.parse()  # Reload to get updated statuses
@@ -533,7 +620,11 @@ class ChecklistProcessor:
             if self._cancelled:
                 logger.info("Processing cancelled by user")
             elif iteration >= self.config.max_iterations:
-                logger.warning(f"Reached max iterations ({self.config.max_iterations})")
+                logger.warning(
+                    "Reached max iterations (%d)",
+                    self.config.max_iterations,
+                    extra={"event": EVENT_MAX_ITERATIONS},
+                )
 
             summary = ProcessingResult(
                 processed=total_processed,
@@ -543,7 +634,10 @@ class ChecklistProcessor:
                 dry_run=self.config.dry_run,
             )
 
-            logger.info(f"Processing complete", extra=summary.to_dict())
+            logger.info(
+                "Processing complete",
+                extra={**summary.to_dict(), "event": EVENT_PROCESSING_COMPLETE},
+            )
             self.run_manager.complete()
 
             return summary
@@ -553,6 +647,9 @@ class ChecklistProcessor:
             self.run_manager.fail(e)
             raise
 
+        finally:
+            await self.update_status_stage.close()
+
     async def _generate_tier_reports(
         self, items: list[ChecklistItem], mission_brief: str | None
     ) -> None:
@@ -664,7 +761,9 @@ class ChecklistProcessor:
 
         if self.config.dry_run:
             logger.info(
-                f"[DRY RUN] Would synthesize {needed} items and append to checklist"
+                "[DRY RUN] Would synthesize %d items and append to checklist",
+                needed,
+                extra={"event": EVENT_DRY_RUN},
             )
             return True
 
@@ -4,29 +4,181 @@ Update Status Stage - updates checklist item status after processing.
 Single responsibility: Update checklist file with new status.
 """
 
+import asyncio
+import sys
+from collections import deque
+from typing import Any
+
 from stageflow import StageContext, StageKind, StageOutput
 
 from ..utils.checklist_parser import ChecklistParser
+from ..utils.stage_inputs import get_many_from
+from .validate_output import ValidateOutputView
 from ..checkpoint import CheckpointManager
 
 
+_VALIDATE_KEYS = ValidateOutputView._fields
+_VALIDATE_DEFAULTS = {"validated": False, "dry_run": False}
+
+
+def _read_validation(inputs) -> ValidateOutputView:
+    """Read validate_output's view, falling back to its keyed fields."""
+    view = inputs.get_from("validate_output", "view")
+    if view is None:
+        return ValidateOutputView(
+            *get_many_from(inputs, "validate_output", _VALIDATE_KEYS, _VALIDATE_DEFAULTS)
+        )
+    return view
+
+
 class UpdateStatusStage:
-    """Stage that updates the checklist item status."""
+    """
+    Stage that updates the checklist item status.
+
+    With defer_writes=True the new status is queued on the parser instead of
+    written immediately; the driver must call flush_deferred() once the batch
+    is done so all rows land in a single checklist rewrite. Deferred items
+    report status_updated=False and get their status events only once that
+    write has succeeded or failed.
+
+    Status events are appended to a submission deque and emitted by a
+    background task woken through an asyncio.Event, so event sink work stays
+    off the per-item path. The deque is unbounded: status events are never
+    dropped. flush_events() waits for the emitter to signal the deque is
+    drained and close() stops the emitter.
+    """
 
     name = "update_status"
     kind = StageKind.WORK
 
-    def __init__(self, parser: ChecklistParser, runs_dir=None):
+    __slots__ = (
+        "parser",
+        "runs_dir",
+        "defer_writes",
+        "_deferred",
+        "_checkpoint_manager",
+        "_events",
+        "_events_ready",
+        "_events_drained",
+        "_event_emitter",
+    )
+
+    STATUS_COMPLETED = sys.intern("✅ Completed")
+    STATUS_PAUSED = sys.intern("⏸️ Paused")
+    STATUS_FAILED = sys.intern("❌ Failed")
+
+    def __init__(
+        self, parser: ChecklistParser, runs_dir=None, defer_writes: bool = False
+    ):
         self.parser = parser
         self.runs_dir = runs_dir
+        self.defer_writes = defer_writes
+        # (ctx, item_id, new_status) queued by execute() until flush_deferred()
+        self._deferred: list[tuple[StageContext, str, str]] = []
+        self._checkpoint_manager = CheckpointManager(runs_dir) if runs_dir else None
+        self._events: deque = deque()
+        # Created with each emitter task, on its loop, so a stage can be
+        # reused across asyncio.run() calls
+        self._events_ready: asyncio.Event | None = None
+        self._events_drained: asyncio.Event | None = None
+        self._event_emitter: asyncio.Task | None = None
+
+    def _emitter_running(self) -> bool:
+        """True if the emitter task is alive on the currently running loop."""
+        emitter = self._event_emitter
+        return (
+            emitter is not None
+            and not emitter.done()
+            and emitter.get_loop() is asyncio.get_running_loop()
+        )
+
+    def _queue_event(self, ctx: StageContext, name: str, payload: dict[str, Any]) -> None:
+        """Submit an event to the emitter, starting it on first use."""
+        # Payloads must stay dicts: try_emit_event merges them into the
+        # correlation-enriched event data, so pre-serialized bytes won't do.
+        self._events.append((ctx, name, payload))
+        if not self._emitter_running():
+            self._events_ready = asyncio.Event()
+            self._events_drained = asyncio.Event()
+            self._event_emitter = asyncio.get_running_loop().create_task(
+                self._emit_events(self._events_ready, self._events_drained)
+            )
+        self._events_drained.clear()
+        self._events_ready.set()
+
+    async def _emit_events(self, ready: asyncio.Event, drained: asyncio.Event) -> None:
+        """Emit queued events through their own context until cancelled."""
+        try:
+            while True:
+                await ready.wait()
+                ready.clear()
+                while self._events:
+                    ctx, name, payload = self._events.popleft()
+                    ctx.try_emit_event(name, payload)
+                drained.set()
+        finally:
+            # Never leave flush_events() waiting on an emitter that has stopped
+            drained.set()
+
+    async def flush_events(self) -> None:
+        """Wait until every queued event has been emitted."""
+        while self._events and self._emitter_running():
+            await self._events_drained.wait()
+
+    async def close(self) -> None:
+        """Emit any queued events and stop the emitter task."""
+        await self.flush_events()
+        if self._emitter_running():
+            self._event_emitter.cancel()
+            try:
+                await self._event_emitter
+            except asyncio.CancelledError:
+                pass
+        self._event_emitter = None
+
+    def _select_status(
+        self, ctx: StageContext, validated: bool, item_id: str
+    ) -> str:
+        """Pick the checklist status for a validated or failed item."""
+        if validated:
+            return self.STATUS_COMPLETED
+
+        # Check for checkpoint - if exists, mark as paused instead of failed
+        run_dir_str = ctx.inputs.get_from("build_prompt", "run_dir")
+        if self._checkpoint_manager and run_dir_str:
+            if self._checkpoint_manager.can_resume(run_dir_str, item_id):
+                return self.STATUS_PAUSED
+        return self.STATUS_FAILED
+
+    async def flush_deferred(self) -> int:
+        """
+        Write every deferred status and emit the matching events.
+
+        Returns the number of checklist rows written. If the write fails,
+        status.update_failed is queued for each deferred item and the error
+        is re-raised; the rows stay queued on the parser for the next flush.
+        """
+        deferred, self._deferred = self._deferred, []
+        try:
+            written = await self.parser.flush_pending()
+        except Exception as e:
+            error = str(e)
+            for ctx, item_id, _ in deferred:
+                self._queue_event(
+                    ctx, "status.update_failed", {"item_id": item_id, "error": error}
+                )
+            raise
+
+        for ctx, item_id, new_status in deferred:
+            self._queue_event(
+                ctx, "status.updated", {"item_id": item_id, "new_status": new_status}
+            )
+        return written
 
     async def execute(self, ctx: StageContext) -> StageOutput:
         """Update the item status in the checklist."""
         # Get validation result
-        validated = ctx.inputs.get_from("validate_output", "validated", default=False)
-        item_id = ctx.inputs.get_from("validate_output", "item_id")
-        dry_run = ctx.inputs.get_from("validate_output", "dry_run", default=False)
-        run_dir_str = ctx.inputs.get_from("build_prompt", "run_dir")
+        validated, item_id, dry_run = _read_validation(ctx.inputs)
 
         if dry_run:
             return StageOutput.ok(
@@ -38,27 +190,23 @@ class UpdateStatusStage:
         if not item_id:
             return StageOutput.fail(error="No item_id provided for status update")
 
-        # Determine new status
-        if validated:
-            new_status = "✅ Completed"
-        else:
-            # Check for checkpoint - if exists, mark as paused instead of failed
-            if self.runs_dir and run_dir_str:
-                from pathlib import Path
-
-                run_dir = Path(run_dir_str)
-                checkpoint_manager = CheckpointManager(self.runs_dir)
-                if checkpoint_manager.can_resume(run_dir, item_id):
-                    new_status = "⏸️ Paused"
-                else:
-                    new_status = "❌ Failed"
-            else:
-                new_status = "❌ Failed"
+        new_status = self._select_status(ctx, validated, item_id)
+
+        if self.defer_writes:
+            self.parser.queue_status_update(item_id, new_status)
+            self._deferred.append((ctx, item_id, new_status))
+            return StageOutput.ok(
+                status_updated=False,
+                status_queued=True,
+                item_id=item_id,
+                new_status=new_status,
+            )
 
         try:
             await self.parser.update_item_status(item_id, new_status)
 
-            ctx.try_emit_event(
+            self._queue_event(
+                ctx,
                 "status.updated",
                 {
                     "item_id": item_id,
@@ -73,14 +221,18 @@ class UpdateStatusStage:
             )
 
         except Exception as e:
-            ctx.try_emit_event(
+            # Rendered once and shared: stageflow formats StageOutput.error
+            # on every failure, so a lazy string would never be skipped.
+            error = str(e)
+            self._queue_event(
+                ctx,
                 "status.update_failed",
                 {
                     "item_id": item_id,
-                    "error": str(e),
+                    "error": error,
                 },
             )
             return StageOutput.fail(
-                error=f"Failed to update status: {e}",
+                error="Failed to update status: " + error,
                 data={"item_id": item_id},
             )
@@ -5,10 +5,15 @@ Single responsibility: Validate agent output meets completion criteria.
 Strict mode: Requires FINAL_REPORT.md to be present, not just completion marker.
 """
 
+from collections import namedtuple
 from pathlib import Path
 from stageflow import StageContext, StageKind, StageOutput
 
 
+# Positional view of the fields downstream stages read, emitted as data["view"]
+ValidateOutputView = namedtuple("ValidateOutputView", "validated item_id dry_run")
+
+
 class ValidateOutputStage:
     """Stage that validates agent output."""
 
@@ -37,6 +42,7 @@ class ValidateOutputStage:
                 validated=True,
                 dry_run=True,
                 item_id=item_id,
+                view=ValidateOutputView(True, item_id, True),
             )
 
         # Check for final report first (stricter validation)
@@ -98,6 +104,7 @@ class ValidateOutputStage:
                 has_final_report=True,
                 output_length=len(output),
                 note="Completed via final report creation",
+                view=ValidateOutputView(True, item_id, False),
             )
 
         # Check for completion marker (secondary check)
@@ -127,4 +134,5 @@ class ValidateOutputStage:
             has_completion_marker=completed,
             has_final_report=has_report,
             output_length=len(output),
+            view=ValidateOutputView(True, item_id, False),
         )
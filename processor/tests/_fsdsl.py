@@ -0,0 +1,26 @@
+"""
+Filesystem layout helper for tests.
+
+build_tree() lays down a run directory from a flat {relative path: contents}
+map with one makedirs per deepest parent directory. A None value marks a
+file whose contents are never read; it is created empty with touch().
+"""
+
+from pathlib import Path
+
+
+def build_tree(root: Path, spec: dict[str, bytes | str | None]) -> None:
+    """Create every file in spec under root, making parent dirs as needed."""
+    root = Path(root)
+    parents = {Path(relpath).parent for relpath in spec}
+    # mkdir(parents=True) on the deepest dirs creates their ancestors too
+    ancestors = {ancestor for parent in parents for ancestor in parent.parents}
+    for parent in parents - ancestors:
+        (root / parent).mkdir(parents=True, exist_ok=True)
+    for relpath, contents in spec.items():
+        if contents is None:
+            (root / relpath).touch()
+            continue
+        if isinstance(contents, str):
+            contents = contents.encode()
+        (root / relpath).write_bytes(contents)
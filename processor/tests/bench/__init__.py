@@ -0,0 +1 @@
+"""Benchmarks for the Checklist Processor (require pytest-benchmark)."""
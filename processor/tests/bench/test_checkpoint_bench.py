@@ -0,0 +1,30 @@
+"""
+Benchmarks for checkpoint persistence.
+
+Not collected by a plain `pytest` run; run with `pytest processor/tests/bench`
+(skipped unless pytest-benchmark is installed). With `--benchmark-disable`
+or under xdist the code runs once and only correctness is checked.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ...checkpoint import Checkpoint, CheckpointManager, Phase
+
+
+def test_load_5000_artifacts(benchmark, tmp_path):
+    """load should parse a 5000-artifact checkpoint in well under 10ms."""
+    run_dir = tmp_path / "TEST-001"
+    manager = CheckpointManager(tmp_path)
+    checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.EXECUTION)
+    for i in range(5000):
+        checkpoint.add_artifact("research", f"research/doc{i}.md")
+    manager.save(run_dir, checkpoint)
+
+    loaded = benchmark(manager.load, run_dir, "TEST-001")
+
+    assert len(loaded.artifacts["research"]) == 5000
+    # No stats when benchmarking is disabled (--benchmark-disable, xdist)
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean < 0.01
@@ -0,0 +1,41 @@
+"""
+Shared pytest configuration for processor tests.
+
+Set PROCESSOR_TEST_TMPFS=1 to put the suite's temp directories on tmpfs
+(/dev/shm) so run-dir fixtures never touch a block device. Only this
+process's tempfile module and tmp_path are redirected; TMPDIR is left alone,
+so subprocesses the tests spawn keep the normal temp directory.
+"""
+
+import os
+import tempfile
+
+_SHM = "/dev/shm"
+_UNSET = object()
+_saved_tempdir = _UNSET
+
+
+def _tmpfs_requested() -> bool:
+    return (
+        os.environ.get("PROCESSOR_TEST_TMPFS") == "1"
+        and os.path.isdir(_SHM)
+        and os.access(_SHM, os.W_OK)
+    )
+
+
+def pytest_configure(config):
+    global _saved_tempdir
+    if not _tmpfs_requested():
+        return
+    base = os.path.join(_SHM, f"processor-tests-{os.getuid()}")
+    os.makedirs(base, exist_ok=True)
+    # tmp_path_factory asks gettempdir() lazily, so this covers tmp_path too
+    _saved_tempdir = tempfile.tempdir
+    tempfile.tempdir = base
+
+
+def pytest_unconfigure(config):
+    global _saved_tempdir
+    if _saved_tempdir is not _UNSET:
+        tempfile.tempdir = _saved_tempdir
+        _saved_tempdir = _UNSET
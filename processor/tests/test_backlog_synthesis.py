@@ -6,6 +6,7 @@ These are real integration tests - no mocks.
 
 import asyncio
 import json
+import shutil
 import tempfile
 from pathlib import Path
 import pytest
@@ -44,6 +45,9 @@ class TestJsonPayloadExtraction:
         )
         self.processor = ChecklistProcessor(self.config)
     
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
     def test_extract_json_from_markdown_block(self):
         """Test extracting JSON from markdown code block."""
         output = '''Here is the generated items:
@@ -133,6 +137,9 @@ class TestItemCoercion:
         )
         self.processor = ChecklistProcessor(self.config)
     
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
     def test_coerce_valid_items(self):
         """Test coercing valid item data."""
         payload = {
@@ -217,6 +224,9 @@ class TestBacklogPromptBuilding:
         )
         self.processor = ChecklistProcessor(self.config)
     
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
     def test_build_prompt_with_mission_brief(self):
         """Test prompt building with mission brief."""
         prompt = self.processor._build_backlog_synthesis_prompt(
@@ -273,6 +283,9 @@ class TestTierReportCleaning:
             repo_root=Path(self.temp_dir),
         )
     
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
     def test_clean_ansi_codes(self):
         """Test removing ANSI escape codes."""
         output = "\x1b[32m# Tier Report\x1b[0m\n\nContent here"
@@ -345,6 +358,9 @@ class TestChecklistAppend:
         
         self.parser = ChecklistParser(self.checklist_path, Path(self.temp_dir))
     
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
     @pytest.mark.asyncio
     async def test_append_items_to_existing_tier(self):
         """Test appending items to an existing tier."""
@@ -8,13 +8,13 @@ Tests cover:
 4. detect_phase_completion - phase completion detection
 """
 
+import itertools
 import json
-import tempfile
-from pathlib import Path
 from datetime import datetime, timezone
 
 import pytest
 
+from ._fsdsl import build_tree
 from ..checkpoint import (
     Phase,
     Checkpoint,
@@ -23,6 +23,43 @@ from ..checkpoint import (
 )
 
 
+# FINAL_REPORT.md payload just over the 100-byte completeness threshold
+_BIG_REPORT_BYTES = ("# Report" + "x" * 100).encode()
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    """A fresh, empty run directory."""
+    return tmp_path
+
+
+@pytest.fixture
+def manager(run_dir):
+    """A CheckpointManager whose runs_dir holds the test's run_dir."""
+    return CheckpointManager(run_dir.parent)
+
+
+@pytest.fixture(scope="class")
+def scanned_artifacts(tmp_path_factory):
+    """Artifacts found by _scan_artifacts in one run dir holding every phase's files."""
+    run_dir = tmp_path_factory.mktemp("prebuilt_artifacts")
+    build_tree(
+        run_dir,
+        {
+            "research/doc1.md": None,
+            "research/doc2.md": None,
+            "tests/test_a.py": None,
+            "tests/b_test.js": None,
+            "results/results.json": None,
+            "results/output_results.json": None,
+        },
+    )
+
+    checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
+    CheckpointManager(run_dir.parent)._scan_artifacts(run_dir, checkpoint)
+    return checkpoint.artifacts
+
+
 class TestPhaseEnum:
     """Tests for Phase enum."""
 
@@ -62,111 +99,77 @@ class TestPhaseEnum:
         """next_phase should return None from COMPLETE."""
         assert Phase.next_phase(Phase.COMPLETE) is None
 
-    def test_from_artifacts_non_existent_dir(self):
+    def test_from_artifacts_non_existent_dir(self, run_dir):
         """from_artifacts should return INIT for non-existent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "non_existent"
-            assert run_dir.exists() is False
-            assert Phase.from_artifacts(run_dir) == Phase.INIT
+        missing_dir = run_dir / "non_existent"
+        assert missing_dir.exists() is False
+        assert Phase.from_artifacts(missing_dir) == Phase.INIT
 
-    def test_from_artifacts_empty_dir(self):
+    def test_from_artifacts_empty_dir(self, run_dir):
         """from_artifacts should return INIT for empty directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "empty_run"
-            run_dir.mkdir()
-            assert Phase.from_artifacts(run_dir) == Phase.INIT
+        assert Phase.from_artifacts(run_dir) == Phase.INIT
 
-    def test_from_artifacts_detects_complete(self):
+    def test_from_artifacts_detects_complete(self, run_dir):
         """from_artifacts should return COMPLETE when FINAL_REPORT.md exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "complete_run"
-            run_dir.mkdir()
-            report = run_dir / "FINAL_REPORT.md"
-            report.write_text("# Final Report\n" + "x" * 100)
-            assert Phase.from_artifacts(run_dir) == Phase.COMPLETE
-
-    def test_from_artifacts_ignores_small_report(self):
+        report = run_dir / "FINAL_REPORT.md"
+        report.write_bytes(_BIG_REPORT_BYTES)
+        assert Phase.from_artifacts(run_dir) == Phase.COMPLETE
+
+    def test_from_artifacts_ignores_small_report(self, run_dir):
         """from_artifacts should NOT return COMPLETE for small FINAL_REPORT.md."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "small_report_run"
-            run_dir.mkdir()
-            report = run_dir / "FINAL_REPORT.md"
-            report.write_text("Short")  # Less than 100 bytes
-            assert Phase.from_artifacts(run_dir) == Phase.INIT
-
-    def test_from_artifacts_detects_report_phase(self):
+        report = run_dir / "FINAL_REPORT.md"
+        report.write_text("Short")  # Less than 100 bytes
+        assert Phase.from_artifacts(run_dir) == Phase.INIT
+
+    def test_from_artifacts_detects_report_phase(self, run_dir):
         """from_artifacts should return REPORT when results exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "results_run"
-            run_dir.mkdir()
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
-            assert Phase.from_artifacts(run_dir) == Phase.REPORT
-
-    def test_from_artifacts_detects_execution_phase(self):
+        build_tree(run_dir, {"results/results.json": None})
+        assert Phase.from_artifacts(run_dir) == Phase.REPORT
+
+    def test_from_artifacts_detects_execution_phase(self, run_dir):
         """from_artifacts should return EXECUTION when tests exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "tests_run"
-            run_dir.mkdir()
-            tests_dir = run_dir / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "test_example.py").write_text("def test(): pass")
-            assert Phase.from_artifacts(run_dir) == Phase.EXECUTION
-
-    def test_from_artifacts_detects_tests_phase_various_patterns(self):
+        build_tree(run_dir, {"tests/test_example.py": None})
+        assert Phase.from_artifacts(run_dir) == Phase.EXECUTION
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "test_example.py",
+            "example_test.py",
+            "example.test.js",
+            "example_test.js",
+            "example_test.rs",
+        ],
+    )
+    def test_from_artifacts_detects_tests_phase_various_patterns(self, run_dir, filename):
         """from_artifacts should detect tests for various naming patterns."""
-        patterns = [
-            ("test_example.py", Phase.EXECUTION),
-            ("example_test.py", Phase.EXECUTION),
-            ("example.test.js", Phase.EXECUTION),
-            ("example_test.js", Phase.EXECUTION),
-            ("example_test.rs", Phase.EXECUTION),
-        ]
-        for filename, expected_phase in patterns:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                run_dir = Path(tmpdir) / f"test_{filename}"
-                run_dir.mkdir()
-                tests_dir = run_dir / "tests"
-                tests_dir.mkdir()
-                (tests_dir / filename).write_text("test code")
-                assert Phase.from_artifacts(run_dir) == expected_phase, (
-                    f"Failed for {filename}"
-                )
-
-    def test_from_artifacts_detects_tests_phase(self):
+        build_tree(run_dir, {f"tests/{filename}": None})
+        assert Phase.from_artifacts(run_dir) == Phase.EXECUTION
+
+    def test_from_artifacts_detects_tests_phase(self, run_dir):
         """from_artifacts should return TESTS when research exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "research_run"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "notes.md").write_text("# Research notes")
-            assert Phase.from_artifacts(run_dir) == Phase.TESTS
-
-    def test_from_artifacts_priorities_complete_over_results(self):
-        """COMPLETE should take priority over REPORT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "complete_with_results"
-            run_dir.mkdir()
-            (run_dir / "FINAL_REPORT.md").write_text("# Report" + "x" * 100)
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
-            assert Phase.from_artifacts(run_dir) == Phase.COMPLETE
-
-    def test_from_artifacts_priorities_results_over_tests(self):
-        """REPORT should take priority over EXECUTION phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "results_with_tests"
-            run_dir.mkdir()
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
-            tests_dir = run_dir / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "test.py").write_text("test")
-            assert Phase.from_artifacts(run_dir) == Phase.REPORT
+        build_tree(run_dir, {"research/notes.md": None})
+        assert Phase.from_artifacts(run_dir) == Phase.TESTS
+
+    @pytest.mark.parametrize(
+        "files, expected_phase",
+        [
+            pytest.param(
+                {"FINAL_REPORT.md": _BIG_REPORT_BYTES, "results/results.json": None},
+                Phase.COMPLETE,
+                id="complete_over_results",
+            ),
+            pytest.param(
+                {"results/results.json": None, "tests/test.py": None},
+                Phase.REPORT,
+                id="results_over_tests",
+            ),
+        ],
+    )
+    def test_from_artifacts_priorities(self, run_dir, files, expected_phase):
+        """Later phases should take priority over earlier ones."""
+        build_tree(run_dir, files)
+        assert Phase.from_artifacts(run_dir) == expected_phase
 
 
 class TestCheckpointDataclass:
@@ -236,6 +239,24 @@ class TestCheckpointDataclass:
         assert checkpoint.errors == ["Error 1"]
         assert checkpoint.metadata == {"key": "value"}
 
+    def test_to_dict_from_dict_roundtrip(self):
+        """from_dict(to_dict()) should reproduce every field but updated_at."""
+        original = Checkpoint(
+            item_id="TEST-001",
+            phase=Phase.EXECUTION,
+            attempt=2,
+            elapsed_ms=120000,
+        )
+        original.add_artifact("research", "doc.md")
+        original.add_artifact("tests", "test.py")
+        original.add_error("Minor issue")
+        original.metadata["key"] = "value"
+
+        restored = Checkpoint.from_dict(original.to_dict())
+        # Constructing a checkpoint, loaded or not, stamps a fresh updated_at
+        restored.updated_at = original.updated_at
+        assert restored == original
+
     def test_from_dict_with_invalid_phase(self):
         """from_dict should raise error for invalid phase."""
         data = {"item_id": "TEST-001", "phase": "invalid_phase"}
@@ -254,13 +275,19 @@ class TestCheckpointDataclass:
         assert checkpoint.advance_phase() is False
         assert checkpoint.phase == Phase.COMPLETE
 
-    def test_advance_phase_updates_timestamp(self):
+    def test_advance_phase_updates_timestamp(self, monkeypatch):
         """advance_phase should update updated_at timestamp."""
+        ticks = itertools.count()
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2024, 1, 1, 0, 0, next(ticks), tzinfo=tz)
+
+        monkeypatch.setattr("processor.checkpoint.datetime", FakeDatetime)
+
         checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
         original_updated = checkpoint.updated_at
-        import time
-
-        time.sleep(0.01)
         checkpoint.advance_phase()
         assert checkpoint.updated_at > original_updated
 
@@ -284,6 +311,28 @@ class TestCheckpointDataclass:
         checkpoint.add_artifact("research", "doc.md")
         assert checkpoint.artifacts == {"research": ["doc.md"]}
 
+    def test_add_artifact_prevents_duplicates_after_from_dict(self):
+        """add_artifact should still dedup artifacts restored by from_dict."""
+        original = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
+        original.add_artifact("research", "doc.md")
+        checkpoint = Checkpoint.from_dict(original.to_dict())
+        checkpoint.add_artifact("research", "doc.md")
+        checkpoint.add_artifact("research", "notes.md")
+        assert checkpoint.artifacts == {"research": ["doc.md", "notes.md"]}
+
+    def test_add_artifact_after_direct_mutation(self):
+        """add_artifact should dedup against the artifacts lists as they are now."""
+        checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
+        checkpoint.add_artifact("research", "a.md")
+        checkpoint.artifacts["research"][0] = "b.md"
+        checkpoint.add_artifact("research", "a.md")
+        assert checkpoint.artifacts == {"research": ["b.md", "a.md"]}
+
+        checkpoint.artifacts["research"].remove("a.md")
+        checkpoint.artifacts["research"].append("c.md")
+        checkpoint.add_artifact("research", "a.md")
+        assert checkpoint.artifacts == {"research": ["b.md", "c.md", "a.md"]}
+
     def test_add_artifact_different_phases(self):
         """add_artifact should track artifacts per phase."""
         checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
@@ -312,375 +361,312 @@ class TestCheckpointDataclass:
 class TestCheckpointManager:
     """Tests for CheckpointManager."""
 
-    def test_manager_creation(self):
+    def test_manager_creation(self, run_dir):
         """CheckpointManager should initialize with runs_dir."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            assert manager.runs_dir == Path(tmpdir)
+        manager = CheckpointManager(run_dir)
+        assert manager.runs_dir == run_dir
 
-    def test_get_checkpoint_path(self):
+    def test_get_checkpoint_path(self, run_dir, manager):
         """get_checkpoint_path should return correct path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "runs" / "TEST-001"
-            path = manager.get_checkpoint_path(run_dir)
-            assert path == run_dir / ".checkpoint.json"
+        path = manager.get_checkpoint_path(run_dir)
+        assert path == run_dir / ".checkpoint.json"
 
-    def test_load_new_checkpoint(self):
+    def test_load_new_checkpoint(self, run_dir, manager):
         """load should create new checkpoint when none exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            checkpoint = manager.load(run_dir, "TEST-001")
-            assert checkpoint.item_id == "TEST-001"
-            assert checkpoint.phase == Phase.INIT
-
-    def test_load_existing_checkpoint(self):
+        checkpoint = manager.load(run_dir, "TEST-001")
+        assert checkpoint.item_id == "TEST-001"
+        assert checkpoint.phase == Phase.INIT
+
+    def test_load_existing_checkpoint(self, run_dir, manager):
         """load should load existing checkpoint from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-
-            existing_checkpoint = Checkpoint(
-                item_id="TEST-001",
-                phase=Phase.RESEARCH,
-            )
-            manager.save(run_dir, existing_checkpoint)
-
-            loaded = manager.load(run_dir, "TEST-001")
-            assert loaded.phase == Phase.RESEARCH
-            assert loaded.item_id == "TEST-001"
-
-    def test_load_detects_existing_progress(self):
+        (run_dir / ".checkpoint.json").write_bytes(
+            b'{"item_id": "TEST-001", "phase": "research", "attempt": 2,'
+            b' "started_at": "2024-01-01T00:00:00+00:00",'
+            b' "updated_at": "2024-01-01T00:05:00+00:00", "elapsed_ms": 300000,'
+            b' "artifacts": {"research": ["research/doc.md"]}, "errors": [],'
+            b' "metadata": {}}'
+        )
+
+        loaded = manager.load(run_dir, "TEST-001")
+        assert loaded.phase == Phase.RESEARCH
+        assert loaded.item_id == "TEST-001"
+        assert loaded.attempt == 2
+        assert loaded.artifacts == {"research": ["research/doc.md"]}
+
+    def test_load_detects_existing_progress(self, run_dir, manager):
         """load should detect phase from existing artifacts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc.md").write_text("# Research")
-            checkpoint = manager.load(run_dir, "TEST-001")
-            assert checkpoint.phase == Phase.TESTS
-            assert "research" in checkpoint.artifacts
-
-    def test_save_and_load_roundtrip(self):
-        """save and load should maintain data integrity."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-
-            original = Checkpoint(
-                item_id="TEST-001",
-                phase=Phase.EXECUTION,
-                attempt=2,
-                elapsed_ms=120000,
-            )
-            original.add_artifact("research", "doc.md")
-            original.add_artifact("tests", "test.py")
-            original.add_error("Minor issue")
-            original.metadata["key"] = "value"
-
-            manager.save(run_dir, original)
-            loaded = manager.load(run_dir, "TEST-001")
-
-            assert loaded.item_id == original.item_id
-            assert loaded.phase == original.phase
-            assert loaded.attempt == original.attempt
-            assert loaded.elapsed_ms == original.elapsed_ms
-            assert loaded.artifacts == original.artifacts
-            assert loaded.errors == original.errors
-            assert loaded.metadata == original.metadata
-
-    def test_delete_checkpoint(self):
+        build_tree(run_dir, {"research/doc.md": None})
+        checkpoint = manager.load(run_dir, "TEST-001")
+        assert checkpoint.phase == Phase.TESTS
+        assert "research" in checkpoint.artifacts
+
+    @pytest.mark.parametrize("serializer", ["orjson", "json"])
+    def test_save_and_load_roundtrip(self, run_dir, manager, monkeypatch, serializer):
+        """load should read back what save wrote, with either serializer."""
+        if serializer == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("processor.checkpoint.orjson", None)
+
+        original = Checkpoint(
+            item_id="TEST-001",
+            phase=Phase.EXECUTION,
+            attempt=2,
+            elapsed_ms=120000,
+        )
+        original.add_artifact("research", "doc.md")
+        original.add_artifact("tests", "test.py")
+        original.add_error("Minor issue")
+        original.metadata.update({"key": "value", "nested": {"ratio": 0.5}})
+
+        manager.save(run_dir, original)
+        loaded = manager.load(run_dir, "TEST-001")
+
+        assert loaded.item_id == original.item_id
+        assert loaded.phase == original.phase
+        assert loaded.attempt == original.attempt
+        assert loaded.started_at == original.started_at
+        assert loaded.elapsed_ms == original.elapsed_ms
+        assert loaded.artifacts == original.artifacts
+        assert loaded.errors == original.errors
+        assert loaded.metadata == original.metadata
+
+    @pytest.mark.parametrize("serializer", ["orjson", "json"])
+    def test_save_stringifies_metadata_keys(
+        self, run_dir, manager, monkeypatch, serializer
+    ):
+        """Non-str metadata keys should be saved as strings by either serializer."""
+        if serializer == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("processor.checkpoint.orjson", None)
+
+        checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.RESEARCH)
+        checkpoint.metadata[2] = "second attempt"
+        manager.save(run_dir, checkpoint)
+        assert manager.load(run_dir, "TEST-001").metadata == {"2": "second attempt"}
+
+    def test_delete_checkpoint(self, run_dir, manager):
         """delete should remove checkpoint file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            checkpoint_path = run_dir / ".checkpoint.json"
-            checkpoint_path.write_text("{}")
-
-            assert checkpoint_path.exists()
-            manager.delete(run_dir)
-            assert checkpoint_path.exists() is False
-
-    def test_delete_nonexistent(self):
+        checkpoint_path = run_dir / ".checkpoint.json"
+        checkpoint_path.touch()
+
+        assert checkpoint_path.exists()
+        manager.delete(run_dir)
+        assert checkpoint_path.exists() is False
+
+    def test_delete_nonexistent(self, run_dir, manager):
         """delete should not fail for non-existent checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            manager.delete(run_dir)  # Should not raise
+        manager.delete(run_dir)  # Should not raise
 
-    def test_can_resume_init_phase(self):
+    def test_can_resume_init_phase(self, run_dir, manager):
         """can_resume should return False for INIT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = manager.can_resume(run_dir, "TEST-001")
-            assert result is False
-
-    def test_can_resume_complete_phase(self):
+        result = manager.can_resume(run_dir, "TEST-001")
+        assert result is False
+
+    def test_can_resume_complete_phase(self, run_dir, manager):
         """can_resume should return False for COMPLETE phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            (run_dir / "FINAL_REPORT.md").write_text("# Report" + "x" * 100)
-            result = manager.can_resume(run_dir, "TEST-001")
-            assert result is False
-
-    def test_can_resume_tests_phase(self):
+        (run_dir / "FINAL_REPORT.md").write_bytes(_BIG_REPORT_BYTES)
+        result = manager.can_resume(run_dir, "TEST-001")
+        assert result is False
+
+    def test_can_resume_tests_phase(self, run_dir, manager):
         """can_resume should return True for TESTS phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc.md").write_text("# Research")
-            result = manager.can_resume(run_dir, "TEST-001")
-            assert result is True
-
-    def test_get_resume_instructions_tests_phase(self):
+        build_tree(run_dir, {"research/doc.md": None})
+        result = manager.can_resume(run_dir, "TEST-001")
+        assert result is True
+
+    def test_can_resume_cached_until_invalidated(self, run_dir):
+        """cache_resume should memoize can_resume until invalidate is called."""
+        manager = CheckpointManager(run_dir.parent, cache_resume=True)
+        assert manager.can_resume(run_dir, "TEST-001") is False
+
+        build_tree(run_dir, {"research/doc.md": None})
+        assert manager.can_resume(run_dir, "TEST-001") is False
+
+        manager.invalidate(run_dir)
+        assert manager.can_resume(run_dir, "TEST-001") is True
+
+    def test_resumable_item_ids(self, run_dir, manager):
+        """resumable_item_ids should list resumable run dirs in one pass."""
+        tier_dir = run_dir / "tier_1"
+        build_tree(
+            tier_dir,
+            {
+                "TEST-001/research/doc.md": None,
+                "TEST-003/research/doc.md": None,
+            },
+        )
+        (tier_dir / "TEST-002").mkdir()
+
+        assert manager.resumable_item_ids(tier_dir) == {"TEST-001", "TEST-003"}
+        assert manager.resumable_item_ids(tier_dir, ["TEST-001", "TEST-009"]) == {
+            "TEST-001"
+        }
+        assert manager.resumable_item_ids(run_dir / "missing") == frozenset()
+
+    def test_get_resume_instructions_tests_phase(self, run_dir, manager):
         """get_resume_instructions should return correct instructions for TESTS phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc.md").write_text("# Research")
+        build_tree(run_dir, {"research/doc.md": None})
 
-            checkpoint = manager.load(run_dir, "TEST-001")
-            instructions = manager.get_resume_instructions(checkpoint)
+        checkpoint = manager.load(run_dir, "TEST-001")
+        instructions = manager.get_resume_instructions(checkpoint)
 
-            assert "Research phase complete" in instructions
-            assert "SKIP research phase" in instructions
+        assert "Research phase complete" in instructions
+        assert "SKIP research phase" in instructions
 
-    def test_get_resume_instructions_execution_phase(self):
+    def test_get_resume_instructions_execution_phase(self, run_dir, manager):
         """get_resume_instructions should return correct instructions for EXECUTION phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            tests_dir = run_dir / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "test_example.py").write_text("test")
+        build_tree(run_dir, {"tests/test_example.py": None})
 
-            checkpoint = manager.load(run_dir, "TEST-001")
-            instructions = manager.get_resume_instructions(checkpoint)
+        checkpoint = manager.load(run_dir, "TEST-001")
+        instructions = manager.get_resume_instructions(checkpoint)
 
-            assert "Tests created" in instructions
-            assert "SKIP research and test creation phases" in instructions
+        assert "Tests created" in instructions
+        assert "SKIP research and test creation phases" in instructions
 
-    def test_get_resume_instructions_report_phase(self):
+    def test_get_resume_instructions_report_phase(self, run_dir, manager):
         """get_resume_instructions should return correct instructions for REPORT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
+        build_tree(run_dir, {"results/results.json": None})
 
-            checkpoint = manager.load(run_dir, "TEST-001")
-            instructions = manager.get_resume_instructions(checkpoint)
+        checkpoint = manager.load(run_dir, "TEST-001")
+        instructions = manager.get_resume_instructions(checkpoint)
 
-            assert "Tests executed" in instructions
-            assert "SKIP all phases except report generation" in instructions
+        assert "Tests executed" in instructions
+        assert "SKIP all phases except report generation" in instructions
 
-    def test_get_resume_instructions_init_phase(self):
+    def test_get_resume_instructions_init_phase(self, run_dir, manager):
         """get_resume_instructions should return empty string for INIT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-
-            checkpoint = manager.load(run_dir, "TEST-001")
-            instructions = manager.get_resume_instructions(checkpoint)
+        checkpoint = manager.load(run_dir, "TEST-001")
+        instructions = manager.get_resume_instructions(checkpoint)
 
-            assert instructions == ""
+        assert instructions == ""
 
-    def test_scan_artifacts_research(self):
+    def test_scan_artifacts_research(self, scanned_artifacts):
         """_scan_artifacts should find research markdown files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc1.md").write_text("# Doc 1")
-            (research_dir / "doc2.md").write_text("# Doc 2")
-
-            checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
-            manager._scan_artifacts(run_dir, checkpoint)
-
-            assert "research" in checkpoint.artifacts
-            assert len(checkpoint.artifacts["research"]) == 2
-
-    def test_scan_artifacts_tests(self):
+        assert sorted(scanned_artifacts["research"]) == [
+            "research/doc1.md",
+            "research/doc2.md",
+        ]
+
+    def test_scan_artifacts_tests(self, scanned_artifacts):
         """_scan_artifacts should find test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            tests_dir = run_dir / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "test_a.py").write_text("test")
-            (tests_dir / "b_test.js").write_text("test")
-
-            checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
-            manager._scan_artifacts(run_dir, checkpoint)
-
-            assert "tests" in checkpoint.artifacts
-            assert len(checkpoint.artifacts["tests"]) == 2
-
-    def test_scan_artifacts_results(self):
+        assert sorted(scanned_artifacts["tests"]) == ["tests/b_test.js", "tests/test_a.py"]
+
+    def test_scan_artifacts_results(self, scanned_artifacts):
         """_scan_artifacts should find result JSON files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
-            (results_dir / "output_results.json").write_text("{}")
+        assert sorted(scanned_artifacts["execution"]) == [
+            "results/output_results.json",
+            "results/results.json",
+        ]
+
+    def test_scan_artifacts_does_not_scan_list(self, run_dir, manager):
+        """_scan_artifacts should dedup through a set, not a scan per file."""
+
+        class ScanCountingList(list):
+            scans = 0
+
+            def __contains__(self, item):
+                ScanCountingList.scans += 1
+                return super().__contains__(item)
 
-            checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
-            manager._scan_artifacts(run_dir, checkpoint)
+            def index(self, *args):
+                ScanCountingList.scans += 1
+                return super().index(*args)
 
-            assert "execution" in checkpoint.artifacts
-            assert len(checkpoint.artifacts["execution"]) == 2
+            def count(self, item):
+                ScanCountingList.scans += 1
+                return super().count(item)
+
+        build_tree(run_dir, {f"research/doc{i}.md": None for i in range(500)})
+        checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.INIT)
+        checkpoint.artifacts["research"] = ScanCountingList(["research/doc0.md"])
+        manager._scan_artifacts(run_dir, checkpoint)
+        assert ScanCountingList.scans == 0
+        assert len(checkpoint.artifacts["research"]) == 500
+        assert checkpoint.artifacts["research"][0] == "research/doc0.md"
 
 
 class TestDetectPhaseCompletion:
     """Tests for detect_phase_completion function."""
 
-    def test_detect_research_phase_complete(self):
+    def test_detect_research_phase_complete(self, run_dir):
         """detect_phase_completion should return True for complete RESEARCH phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc.md").write_text("# Research")
-            result = detect_phase_completion(run_dir, Phase.RESEARCH)
-            assert result is True
-
-    def test_detect_research_phase_incomplete(self):
+        build_tree(run_dir, {"research/doc.md": None})
+        result = detect_phase_completion(run_dir, Phase.RESEARCH)
+        assert result is True
+
+    def test_detect_research_phase_incomplete(self, run_dir):
         """detect_phase_completion should return False for incomplete RESEARCH phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = detect_phase_completion(run_dir, Phase.RESEARCH)
-            assert result is False
+        result = detect_phase_completion(run_dir, Phase.RESEARCH)
+        assert result is False
 
-    def test_detect_tests_phase_complete(self):
+    def test_detect_tests_phase_complete(self, run_dir):
         """detect_phase_completion should return True for complete TESTS phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            tests_dir = run_dir / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "test_example.py").write_text("test")
-            result = detect_phase_completion(run_dir, Phase.TESTS)
-            assert result is True
-
-    def test_detect_tests_phase_incomplete(self):
+        build_tree(run_dir, {"tests/test_example.py": None})
+        result = detect_phase_completion(run_dir, Phase.TESTS)
+        assert result is True
+
+    def test_detect_tests_phase_incomplete(self, run_dir):
         """detect_phase_completion should return False for incomplete TESTS phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = detect_phase_completion(run_dir, Phase.TESTS)
-            assert result is False
+        result = detect_phase_completion(run_dir, Phase.TESTS)
+        assert result is False
 
-    def test_detect_execution_phase_complete(self):
+    def test_detect_execution_phase_complete(self, run_dir):
         """detect_phase_completion should return True for complete EXECUTION phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            results_dir = run_dir / "results"
-            results_dir.mkdir()
-            (results_dir / "results.json").write_text("{}")
-            result = detect_phase_completion(run_dir, Phase.EXECUTION)
-            assert result is True
-
-    def test_detect_execution_phase_incomplete(self):
+        build_tree(run_dir, {"results/results.json": None})
+        result = detect_phase_completion(run_dir, Phase.EXECUTION)
+        assert result is True
+
+    def test_detect_execution_phase_incomplete(self, run_dir):
         """detect_phase_completion should return False for incomplete EXECUTION phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = detect_phase_completion(run_dir, Phase.EXECUTION)
-            assert result is False
+        result = detect_phase_completion(run_dir, Phase.EXECUTION)
+        assert result is False
 
-    def test_detect_report_phase_complete(self):
+    def test_detect_report_phase_complete(self, run_dir):
         """detect_phase_completion should return True for complete REPORT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            report = run_dir / "FINAL_REPORT.md"
-            report.write_text("# Report" + "x" * 100)
-            result = detect_phase_completion(run_dir, Phase.REPORT)
-            assert result is True
-
-    def test_detect_report_phase_small_report(self):
+        report = run_dir / "FINAL_REPORT.md"
+        report.write_bytes(_BIG_REPORT_BYTES)
+        result = detect_phase_completion(run_dir, Phase.REPORT)
+        assert result is True
+
+    def test_detect_report_phase_small_report(self, run_dir):
         """detect_phase_completion should return False for small FINAL_REPORT.md."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            report = run_dir / "FINAL_REPORT.md"
-            report.write_text("Short")
-            result = detect_phase_completion(run_dir, Phase.REPORT)
-            assert result is False
-
-    def test_detect_init_phase_always_false(self):
+        report = run_dir / "FINAL_REPORT.md"
+        report.write_text("Short")
+        result = detect_phase_completion(run_dir, Phase.REPORT)
+        assert result is False
+
+    def test_detect_init_phase_always_false(self, run_dir):
         """detect_phase_completion should return False for INIT phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = detect_phase_completion(run_dir, Phase.INIT)
-            assert result is False
+        result = detect_phase_completion(run_dir, Phase.INIT)
+        assert result is False
 
-    def test_detect_complete_phase_always_false(self):
+    def test_detect_complete_phase_always_false(self, run_dir):
         """detect_phase_completion should return False for COMPLETE phase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            result = detect_phase_completion(run_dir, Phase.COMPLETE)
-            assert result is False
+        result = detect_phase_completion(run_dir, Phase.COMPLETE)
+        assert result is False
 
 
 class TestCheckpointEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_load_corrupted_checkpoint(self):
+    def test_load_corrupted_checkpoint(self, run_dir, manager):
         """load should recover from corrupted checkpoint file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "TEST-001"
-            run_dir.mkdir()
-            checkpoint_path = run_dir / ".checkpoint.json"
-            checkpoint_path.write_text("invalid json{")
-
-            checkpoint = manager.load(run_dir, "TEST-001")
-            assert checkpoint.phase == Phase.INIT
-            assert checkpoint.item_id == "TEST-001"
-
-    def test_save_to_nonexistent_directory(self):
+        checkpoint_path = run_dir / ".checkpoint.json"
+        checkpoint_path.write_text("invalid json{")
+
+        checkpoint = manager.load(run_dir, "TEST-001")
+        assert checkpoint.phase == Phase.INIT
+        assert checkpoint.item_id == "TEST-001"
+
+    def test_save_to_nonexistent_directory(self, run_dir, manager):
         """save should create parent directories if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = CheckpointManager(Path(tmpdir))
-            run_dir = Path(tmpdir) / "nested" / "path" / "TEST-001"
-            checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.RESEARCH)
+        nested_dir = run_dir / "nested" / "path" / "TEST-001"
+        checkpoint = Checkpoint(item_id="TEST-001", phase=Phase.RESEARCH)
 
-            manager.save(run_dir, checkpoint)
-            assert (run_dir / ".checkpoint.json").exists()
+        manager.save(nested_dir, checkpoint)
+        assert (nested_dir / ".checkpoint.json").exists()
 
     def test_checkpoint_with_empty_artifacts(self):
         """Checkpoint should handle empty artifacts dict."""
@@ -690,15 +676,10 @@ class TestCheckpointEdgeCases:
         result = checkpoint.to_dict()
         assert result["artifacts"] == {"research": []}
 
-    def test_phase_from_artifacts_with_nested_dirs(self):
+    def test_phase_from_artifacts_with_nested_dirs(self, run_dir):
         """from_artifacts should work with nested directory structures."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            run_dir = Path(tmpdir) / "project"
-            run_dir.mkdir()
-            research_dir = run_dir / "research"
-            research_dir.mkdir()
-            (research_dir / "doc.md").write_text("# Research")
-            assert Phase.from_artifacts(run_dir) == Phase.TESTS
+        build_tree(run_dir, {"research/doc.md": None})
+        assert Phase.from_artifacts(run_dir) == Phase.TESTS
 
 
 if __name__ == "__main__":
@@ -0,0 +1,449 @@
+"""
+Tests for logging setup.
+
+Tests cover:
+1. SuppressFilter - records dropped before formatting
+2. CleanFormatter - processor message parsing and rendering
+3. BufferedStreamHandler - records coalesced into few writes
+4. ContextLogger - context carried to records as extra_data
+5. setup_logging - suppressed loggers raised above their dropped levels
+"""
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from ..utils.logger import (
+    EVENT_ITEM_STARTED,
+    EVENT_PRIORITIZING,
+    BufferedStreamHandler,
+    CleanFormatter,
+    ContextLogger,
+    ContextRecord,
+    SuppressFilter,
+    _fmt_time,
+    _stage_template,
+    setup_logging,
+)
+
+
+def make_record(
+    name: str, level: int, msg: str = "message", **extra
+) -> logging.LogRecord:
+    record = ContextRecord(name, level, __file__, 1, msg, None, None)
+    if extra:
+        record.extra_data = extra
+    return record
+
+
+class TestSuppressFilter:
+    """Tests for SuppressFilter."""
+
+    @pytest.mark.parametrize(
+        "name, level, expected",
+        [
+            ("observability", logging.INFO, False),
+            ("observability", logging.ERROR, True),
+            ("processor", logging.INFO, True),
+            ("run_agent", logging.DEBUG, True),
+            ("checkpoint", logging.WARNING, False),
+            ("stageflow", logging.WARNING, False),
+            ("cli", logging.INFO, False),
+            ("cli", logging.WARNING, True),
+            ("httpx", logging.ERROR, True),
+        ],
+    )
+    def test_quiet_mode(self, name, level, expected):
+        """Outside verbose mode only records the formatter would render pass."""
+        assert SuppressFilter().filter(make_record(name, level)) is expected
+
+    def test_verbose_mode_passes_all_but_observability(self):
+        """Verbose mode should pass everything except observability noise."""
+        verbose = SuppressFilter(verbose=True)
+        assert verbose.filter(make_record("stageflow", logging.DEBUG)) is True
+        assert verbose.filter(make_record("checkpoint", logging.DEBUG)) is True
+        assert verbose.filter(make_record("observability", logging.INFO)) is False
+
+    def test_filtered_record_is_never_formatted(self):
+        """A dropped record's message should not be %-formatted."""
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a suppressed record")
+
+        record = make_record("stageflow", logging.INFO, "%s")
+        record.args = (Exploding(),)
+        handler = logging.Handler()
+        handler.addFilter(SuppressFilter())
+        handler.emit = lambda record: record.getMessage()
+        assert not handler.handle(record)
+
+
+class TestCleanFormatter:
+    """Tests for CleanFormatter."""
+
+    def setup_method(self):
+        self.formatter = CleanFormatter(use_colors=False)
+
+    def format(self, msg: str, **extra) -> str:
+        return self.formatter.format(make_record("processor", logging.INFO, msg, **extra))
+
+    def test_iteration_banner_updates_state(self):
+        """Starting iteration should record iteration and max without output."""
+        assert self.format("Starting iteration 3/10") == ""
+        assert self.formatter._state["iteration"] == 3
+        assert self.formatter._state["max_iterations"] == 10
+
+    def test_item_start_tracks_current_item(self):
+        """Starting <item> with a tier should set the current item."""
+        assert self.format("Starting API-001", tier="Tier 1") == ""
+        assert self.formatter._state["current_item"] == "API-001"
+
+    def test_failed_item_shows_error_detail(self):
+        """Failed messages should show the text after the first colon."""
+        assert self.format("Failed API-001: boom: x", error_type="E") == "\n✗ boom: x"
+        assert self.formatter._state["failed_count"] == 1
+
+    def test_prioritizing_shows_resume_count(self):
+        """Prioritizing messages should report how many items resume."""
+        message = "Prioritizing 4 items with incomplete checkpoints"
+        assert self.format(message) == "↻ Resuming 4 incomplete items"
+
+    def test_plain_log_record_is_formatted(self):
+        """Records not built by ContextRecord should format with empty context."""
+        record = logging.LogRecord(
+            "other", logging.WARNING, __file__, 1, "hi", None, None
+        )
+        assert self.formatter.format(record).endswith("] WARNING: hi")
+
+    def test_error_without_type_gets_generic_label(self):
+        """Errors without error_type or exc_info should be labelled Error."""
+        record = make_record("other", logging.ERROR, "boom")
+        assert "  Error: boom" in self.formatter.format(record).splitlines()
+
+    def test_dispatch_by_logger_name(self):
+        """Records route to their logger's formatter, others to the default."""
+        formatter = CleanFormatter(use_colors=False, verbose=True)
+        checkpoint = make_record("checkpoint", logging.INFO, "saved")
+        assert formatter.format(checkpoint) == "[checkpoint] saved"
+        other = make_record("other", logging.WARNING, "careful")
+        assert formatter.format(other).endswith("] WARNING: careful")
+
+    def test_event_takes_precedence_over_message(self):
+        """Records carrying an event should be handled from extra, not text."""
+        assert self.format("%s", event=EVENT_ITEM_STARTED, item_id="API-002") == ""
+        assert self.formatter._state["current_item"] == "API-002"
+        resuming = self.format("x", event=EVENT_PRIORITIZING, count=2)
+        assert resuming == "↻ Resuming 2 incomplete items"
+
+    def test_message_not_rendered_for_silent_events(self):
+        """Silent events should never build the record's message."""
+        record = make_record(
+            "processor", logging.INFO, "Re-queued %d items", event="requeued"
+        )
+        record.args = ("not a number",)
+        assert self.formatter.format(record) == ""
+
+    def test_final_summary_lines(self):
+        """The final summary only lists failures when there are some."""
+        clean = self.format("Processing complete", processed=2, completed=2, failed=0)
+        assert clean.splitlines() == [
+            "",
+            "━━━ Final Summary ━━━",
+            "  ✓ Completed: 2",
+            "  Total processed: 2",
+        ]
+        failed = self.format("Processing complete", processed=3, completed=2, failed=1)
+        assert "  ✗ Failed: 1" in failed.splitlines()
+
+    def test_error_block_is_framed(self):
+        """Errors should render between two rules with their context."""
+        record = make_record("other", logging.ERROR, "boom", item_id="API-001")
+        lines = self.formatter.format(record).splitlines()
+        assert lines[1] == lines[-1] == "─" * 60
+        assert "  Item: API-001" in lines
+
+    @pytest.mark.parametrize(
+        "phase,completed,expected",
+        [
+            ("report", [], "report:7s"),
+            ("cleanup", ["init"], "report → cleanup:7s"),
+            ("tests", ["tests"], "tests✓ → execution → report"),
+        ],
+    )
+    def test_stage_line_timer_slot(self, phase, completed, expected):
+        """The phase timer should be filled in wherever the phase sits."""
+        record = make_record(
+            "run_agent",
+            logging.INFO,
+            "Progress:",
+            phase=phase,
+            phase_sec=7,
+            completed_phases=completed,
+        )
+        assert self.formatter.format(record).endswith(expected)
+
+    def test_stage_template_cached_across_seconds(self):
+        """Progress records differing only in elapsed time should share a template."""
+        _stage_template.cache_clear()
+        for sec in range(5):
+            record = make_record(
+                "run_agent", logging.INFO, "Progress:", phase="tests", phase_sec=sec
+            )
+            self.formatter.format(record)
+        assert _stage_template.cache_info().misses == 1
+
+    def test_status_panel_header(self):
+        """The panel header should show iteration, counts and elapsed time."""
+        self.formatter._state.update(iteration=2, max_iterations=5, failed_count=1)
+        record = make_record(
+            "run_agent", logging.INFO, "Progress:", item_id="API-001", elapsed=61
+        )
+        header = self.formatter.format(record).splitlines()[0]
+        assert header == "▶ API-001 iter 2/5 │ 0 done 1 fail │ 1:01"
+
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [(0, "0s"), (59, "59s"), (60, "1:00"), (3599, "59:59"), (3661, "1:01:01")],
+    )
+    def test_fmt_time(self, seconds, expected):
+        """Elapsed seconds should render as Ns, M:SS or H:MM:SS."""
+        assert _fmt_time(seconds) == expected
+
+    def test_status_panel_stage_line(self):
+        """The stage line should mark done, current and pending phases."""
+        record = make_record(
+            "run_agent",
+            logging.INFO,
+            "Progress: API-001",
+            item_id="API-001",
+            phase="tests",
+            phase_sec=75,
+            completed_phases=["init", "research"],
+        )
+        panel = self.formatter.format(record)
+        assert panel.endswith("init✓ → research✓ → tests:1:15 → execution → report")
+
+    def test_timestamp_rendered_once_per_second(self, monkeypatch):
+        """_now_hms should only call strftime when the second changes."""
+        calls = []
+        strftime = time.strftime
+        monkeypatch.setattr(
+            "processor.utils.logger.time.strftime",
+            lambda fmt, t: calls.append(t) or strftime(fmt, t),
+        )
+        now = iter([100.1, 100.9, 101.2])
+        monkeypatch.setattr("processor.utils.logger.time.time", lambda: next(now))
+
+        first = self.formatter._now_hms()
+        assert self.formatter._now_hms() is first
+        self.formatter._now_hms()
+        assert len(calls) == 2
+
+
+class RecordingStream:
+    """Stream that keeps each write() call separately."""
+
+    def __init__(self):
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> None:
+        self.writes.append(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class TestBufferedStreamHandler:
+    """Tests for BufferedStreamHandler."""
+
+    def setup_method(self):
+        self.stream = RecordingStream()
+        self.handler = BufferedStreamHandler(self.stream, capacity=3, interval=60)
+
+    def teardown_method(self):
+        self.handler.flush()
+        self.handler.close()
+
+    def emit(self, level: int = logging.INFO, msg: str = "line") -> None:
+        self.handler.emit(make_record("test", level, msg))
+
+    def test_writes_once_capacity_is_reached(self):
+        """Records should be held until capacity, then written in one call."""
+        self.emit(msg="a")
+        self.emit(msg="b")
+        assert self.stream.writes == []
+        self.emit(msg="c")
+        assert self.stream.writes == ["a\nb\nc\n"]
+
+    def test_warning_flushes_immediately(self):
+        """A WARNING record should push out everything pending."""
+        self.emit(msg="a")
+        self.emit(logging.WARNING, "careful")
+        assert self.stream.writes == ["a\ncareful\n"]
+
+    def test_flush_writes_leftovers(self):
+        """flush() should write pending records and then do nothing."""
+        self.emit(msg="a")
+        self.handler.flush()
+        self.handler.flush()
+        assert self.stream.writes == ["a\n"]
+
+    def test_flusher_writes_held_records(self):
+        """Held records should be written after the interval with no new records."""
+        written = threading.Event()
+        self.stream.flush = written.set
+        handler = BufferedStreamHandler(self.stream, capacity=3, interval=0.01)
+        handler.emit(make_record("test", logging.INFO, "a"))
+        assert written.wait(timeout=5)
+        assert self.stream.writes == ["a\n"]
+
+        written.clear()
+        handler.emit(make_record("test", logging.INFO, "b"))
+        assert written.wait(timeout=5)
+        assert self.stream.writes == ["a\n", "b\n"]
+        handler.close()
+
+    def test_one_flusher_thread_serves_every_batch(self):
+        """Held batches should reuse one flusher thread, which close() stops."""
+        for _ in range(3):
+            self.emit(msg="a")
+            self.handler.flush()
+        flusher = self.handler._flusher
+        assert flusher is not None and flusher.is_alive()
+        assert self.stream.writes == ["a\n"] * 3
+
+        self.handler.close()
+        flusher.join(timeout=5)
+        assert not flusher.is_alive()
+
+    def test_terminal_writes_every_record(self):
+        """On a TTY records should not be held back."""
+        self.stream.isatty = lambda: True
+        handler = BufferedStreamHandler(self.stream, capacity=3, interval=60)
+        handler.emit(make_record("test", logging.INFO, "a"))
+        assert self.stream.writes == ["a\n"]
+
+    def test_write_errors_go_to_handle_error(self, monkeypatch):
+        """A broken stream must not raise out of the logging call."""
+
+        def broken(text):
+            raise BrokenPipeError
+
+        self.stream.write = broken
+        errors = []
+        monkeypatch.setattr(self.handler, "handleError", errors.append)
+        self.emit(logging.WARNING, "careful")
+        assert len(errors) == 1
+
+
+class TestContextLogger:
+    """Tests for ContextLogger with the ContextRecord factory."""
+
+    @pytest.fixture
+    def records(self):
+        factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(ContextRecord)
+        logger = logging.getLogger("test_context_logger")
+        handler = logging.Handler()
+        captured = []
+        handler.emit = captured.append
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        yield logger, captured
+        logger.removeHandler(handler)
+        logging.setLogRecordFactory(factory)
+
+    def test_context_reaches_extra_data(self, records):
+        """Adapter context and call-site extra should both land on the record."""
+        logger, captured = records
+        ContextLogger(logger, {"item_id": "API-001"}).info("x", extra={"tier": 1})
+        assert captured[0].extra_data["item_id"] == "API-001"
+        assert captured[0].extra_data["tier"] == 1
+
+    def test_plain_record_has_empty_extra_data(self, records):
+        """Records logged without context should share the empty default."""
+        logger, captured = records
+        ContextLogger(logger, {}).info("x")
+        assert captured[0].extra_data == {}
+        assert "extra_data" not in captured[0].__dict__
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    NAMES = sorted(SuppressFilter.SUPPRESSED | {"observability"})
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        factory = logging.getLogRecordFactory()
+        levels = {name: logging.getLogger(name).level for name in self.NAMES}
+        yield
+        root.handlers, root.level = handlers, level
+        logging.setLogRecordFactory(factory)
+        for name, saved in levels.items():
+            logging.getLogger(name).setLevel(saved)
+
+    def test_quiet_loggers_only_log_errors(self):
+        """Outside verbose mode suppressed loggers should drop sub-ERROR records."""
+        setup_logging()
+        for name in self.NAMES:
+            logger = logging.getLogger(name)
+            assert not logger.isEnabledFor(logging.WARNING)
+            assert logger.isEnabledFor(logging.ERROR)
+
+    def test_keeps_foreign_record_factory(self):
+        """A record factory installed by someone else should not be replaced."""
+
+        def factory(*args, **kwargs):
+            return logging.LogRecord(*args, **kwargs)
+
+        logging.setLogRecordFactory(factory)
+        setup_logging()
+        assert logging.getLogRecordFactory() is factory
+
+    def test_verbose_enables_all_but_observability(self):
+        """Verbose mode should let suppressed loggers through except observability."""
+        setup_logging(verbose=True)
+        assert logging.getLogger("checkpoint").isEnabledFor(logging.DEBUG)
+        assert logging.getLogger("httpx").isEnabledFor(logging.DEBUG)
+        assert not logging.getLogger("observability").isEnabledFor(logging.INFO)
+
+    def test_structured_path_writes_json_lines(self, tmp_path):
+        """Records should land in the side file with their context, unformatted."""
+        path = tmp_path / "logs" / "processor.jsonl"
+        setup_logging(verbose=True, structured_path=path)
+        logger = ContextLogger(logging.getLogger("checkpoint"), {"item_id": "API-001"})
+        logger.debug("saved %s", "research")
+        for handler in logging.getLogger().handlers:
+            handler.close()
+
+        entry = json.loads(path.read_text().splitlines()[-1])
+        assert entry["n"] == "checkpoint"
+        assert entry["m"] == "saved %s"
+        assert entry["a"] == ["research"]
+        assert entry["x"] == {"item_id": "API-001"}
+
+    def test_structured_path_receives_suppressed_loggers(self, tmp_path):
+        """The side file should get quiet loggers the console still hides."""
+        path = tmp_path / "processor.jsonl"
+        setup_logging(structured_path=path)
+        for name in ("checkpoint", "observability"):
+            logging.getLogger(name).info("hidden on console")
+        console = logging.getLogger().handlers[0]
+        for handler in logging.getLogger().handlers:
+            handler.close()
+
+        names = [json.loads(line)["n"] for line in path.read_text().splitlines()]
+        assert names == ["checkpoint", "observability"]
+        record = logging.LogRecord("checkpoint", logging.INFO, "", 0, "x", (), None)
+        assert not console.filter(record)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -297,6 +297,15 @@ class TestProcessorConfigWithRobustness:
             config = ProcessorConfig(repo_root=tmpdir, timeouts=custom_timeouts)
             assert config.timeouts.p0_critical_ms == 1800000
 
+    def test_config_resolves_log_json_against_repo_root(self):
+        """A relative log_json path should live under repo_root."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checklist = Path(tmpdir) / "SUT-CHECKLIST.md"
+            checklist.write_text("# Test\n")
+
+            config = ProcessorConfig(repo_root=tmpdir, log_json="logs/run.jsonl")
+            assert config.log_json == Path(tmpdir) / "logs" / "run.jsonl"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,337 @@
+"""
+Tests for checklist status updates.
+
+Tests cover:
+1. ChecklistParser batch updates - single rewrite for many items
+2. UpdateStatusStage - status selection and deferred writes
+3. ChecklistProcessor - one deferred flush per batch and its failure path
+"""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ..config import ProcessorConfig
+from ..models import AgentStatus
+from ..processor import ChecklistProcessor
+from ..stages.update_status import UpdateStatusStage
+from ..stages.validate_output import ValidateOutputView
+from ..utils.checklist_parser import ChecklistParser
+
+
+CHECKLIST = """# Test Checklist
+
+## Tier 1: API Basics
+
+| ID | Target | Priority | Risk | Status |
+|----|--------|----------|------|--------|
+| API-001 | First endpoint | High | Low | ☐ Not Started |
+| API-002 | Second endpoint | High | Low | ☐ Not Started |
+| API-0021 | Similar ID | Low | Low | ☐ Not Started |
+| API-003 | Follow-up to API-001 | Low | Low | ☐ Not Started |
+"""
+
+
+def make_ctx(validated=True, item_id="API-001", dry_run=False, run_dir=None, view=None):
+    """Build a mock StageContext with validate_output/build_prompt inputs."""
+    values = {
+        ("validate_output", "validated"): validated,
+        ("validate_output", "item_id"): item_id,
+        ("validate_output", "dry_run"): dry_run,
+        ("build_prompt", "run_dir"): run_dir,
+    }
+    if view is not None:
+        values[("validate_output", "view")] = view
+    outputs = {}
+    for (stage, key), value in values.items():
+        outputs.setdefault(stage, MagicMock(data={})).data[key] = value
+
+    ctx = MagicMock()
+    ctx.inputs.get_from = MagicMock(
+        side_effect=lambda stage, key, default=None: values.get((stage, key), default)
+    )
+    ctx.inputs.get_output = MagicMock(side_effect=outputs.get)
+    ctx.try_emit_event = MagicMock()
+    return ctx
+
+
+class TestChecklistBatchUpdate:
+    """Tests for ChecklistParser batch status updates."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checklist_path = Path(self.temp_dir) / "SUT-CHECKLIST.md"
+        self.checklist_path.write_text(CHECKLIST)
+        self.parser = ChecklistParser(self.checklist_path, Path(self.temp_dir))
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def statuses(self) -> dict[str, str]:
+        return {item.id: item.status for item in self.parser.parse()}
+
+    @pytest.mark.asyncio
+    async def test_batch_updates_all_items(self):
+        """update_item_status_batch should apply every update."""
+        await self.parser.update_item_status_batch(
+            [("API-001", "✅ Completed"), ("API-002", "❌ Failed")]
+        )
+        statuses = self.statuses()
+        assert statuses["API-001"] == "✅ Completed"
+        assert statuses["API-002"] == "❌ Failed"
+        assert statuses["API-0021"] == "☐ Not Started"
+        assert statuses["API-003"] == "☐ Not Started"
+
+    @pytest.mark.asyncio
+    async def test_flush_pending_writes_queued_updates(self):
+        """flush_pending should write queued updates and clear the queue."""
+        self.parser.queue_status_update("API-001", "⏸️ Paused")
+        self.parser.queue_status_update("API-002", "✅ Completed")
+        assert self.statuses()["API-001"] == "☐ Not Started"
+
+        assert await self.parser.flush_pending() == 2
+        assert await self.parser.flush_pending() == 0
+        statuses = self.statuses()
+        assert statuses["API-001"] == "⏸️ Paused"
+        assert statuses["API-002"] == "✅ Completed"
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_updates_queued(self, monkeypatch):
+        """A failed write should leave every queued update for the next flush."""
+        self.parser.queue_status_update("API-001", "✅ Completed")
+
+        def fail(path, content):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.parser, "write_atomically", fail)
+        with pytest.raises(OSError):
+            await self.parser.flush_pending()
+
+        monkeypatch.undo()
+        assert await self.parser.flush_pending() == 1
+        assert self.statuses()["API-001"] == "✅ Completed"
+
+
+class TestUpdateStatusStage:
+    """Tests for UpdateStatusStage."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checklist_path = Path(self.temp_dir) / "SUT-CHECKLIST.md"
+        self.checklist_path.write_text(CHECKLIST)
+        self.parser = ChecklistParser(self.checklist_path, Path(self.temp_dir))
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_skips_update(self):
+        """Dry runs should not touch the checklist."""
+        stage = UpdateStatusStage(parser=self.parser)
+        result = await stage.execute(make_ctx(dry_run=True))
+        assert result.status.value == "ok"
+        assert result.data["status_updated"] is False
+        assert result.data["item_id"] == "API-001"
+
+    @pytest.mark.asyncio
+    async def test_reads_validate_output_view(self):
+        """The positional view from validate_output should take precedence."""
+        stage = UpdateStatusStage(parser=self.parser)
+        ctx = make_ctx(item_id=None, view=ValidateOutputView(True, "API-002", False))
+        result = await stage.execute(ctx)
+        assert result.data["item_id"] == "API-002"
+        assert result.data["new_status"] == "✅ Completed"
+
+    @pytest.mark.asyncio
+    async def test_missing_item_id_fails(self):
+        """A missing item_id should fail the stage."""
+        stage = UpdateStatusStage(parser=self.parser)
+        result = await stage.execute(make_ctx(item_id=None))
+        assert result.status.value == "fail"
+
+    @pytest.mark.asyncio
+    async def test_failed_item_with_checkpoint_is_paused(self):
+        """A failed item with resumable progress should be marked paused."""
+        runs_dir = Path(self.temp_dir) / "runs"
+        run_dir = runs_dir / "API-001"
+        (run_dir / "research").mkdir(parents=True)
+        (run_dir / "research" / "doc.md").write_text("# Research")
+
+        stage = UpdateStatusStage(parser=self.parser, runs_dir=runs_dir)
+        result = await stage.execute(make_ctx(validated=False, run_dir=str(run_dir)))
+        assert result.data["new_status"] == "⏸️ Paused"
+
+    @pytest.mark.asyncio
+    async def test_deferred_writes_wait_for_flush(self):
+        """With defer_writes nothing is reported written until flush_deferred()."""
+        stage = UpdateStatusStage(parser=self.parser, defer_writes=True)
+        ctx = make_ctx()
+        result = await stage.execute(ctx)
+        assert result.data["new_status"] == "✅ Completed"
+        assert result.data["status_updated"] is False
+        assert "✅ Completed" not in self.checklist_path.read_text()
+        await stage.flush_events()
+        ctx.try_emit_event.assert_not_called()
+
+        assert await stage.flush_deferred() == 1
+        await stage.flush_events()
+        assert "✅ Completed" in self.checklist_path.read_text()
+        ctx.try_emit_event.assert_called_once_with(
+            "status.updated", {"item_id": "API-001", "new_status": "✅ Completed"}
+        )
+        await stage.close()
+
+    @pytest.mark.asyncio
+    async def test_deferred_flush_failure_reports_every_item(self, monkeypatch):
+        """A failed flush should emit update_failed per item and re-raise."""
+        stage = UpdateStatusStage(parser=self.parser, defer_writes=True)
+        contexts = [make_ctx(item_id="API-001"), make_ctx(item_id="API-002")]
+        for ctx in contexts:
+            await stage.execute(ctx)
+
+        def fail(path, content):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.parser, "write_atomically", fail)
+        with pytest.raises(OSError):
+            await stage.flush_deferred()
+        await stage.flush_events()
+
+        for ctx, item_id in zip(contexts, ["API-001", "API-002"]):
+            ctx.try_emit_event.assert_called_once_with(
+                "status.update_failed", {"item_id": item_id, "error": "disk full"}
+            )
+        assert "✅ Completed" not in self.checklist_path.read_text()
+        await stage.close()
+
+    @pytest.mark.asyncio
+    async def test_status_event_emitted_after_flush(self):
+        """status.updated should be emitted by the drain task."""
+        stage = UpdateStatusStage(parser=self.parser)
+        ctx = make_ctx()
+        await stage.execute(ctx)
+        await stage.flush_events()
+        ctx.try_emit_event.assert_called_once_with(
+            "status.updated", {"item_id": "API-001", "new_status": "✅ Completed"}
+        )
+        await stage.close()
+
+    @pytest.mark.asyncio
+    async def test_status_events_are_never_dropped(self):
+        """A burst of events larger than any queue bound should all be emitted."""
+        stage = UpdateStatusStage(parser=self.parser)
+        ctx = make_ctx()
+        for i in range(2000):
+            stage._queue_event(ctx, "status.updated", {"item_id": str(i)})
+        await stage.flush_events()
+        assert ctx.try_emit_event.call_count == 2000
+        await stage.close()
+
+    def test_stage_reused_across_event_loops(self):
+        """Events should still flow after the first event loop has closed."""
+        stage = UpdateStatusStage(parser=self.parser)
+        contexts = [make_ctx(), make_ctx()]
+
+        async def run(ctx):
+            await stage.execute(ctx)
+            await stage.flush_events()
+
+        for ctx in contexts:
+            asyncio.run(run(ctx))
+            ctx.try_emit_event.assert_called_once()
+        asyncio.run(stage.close())
+
+
+class TestProcessorStatusFlush:
+    """Tests for the processor's per-batch flush of deferred statuses."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checklist_path = Path(self.temp_dir) / "SUT-CHECKLIST.md"
+        self.checklist_path.write_text(CHECKLIST)
+        config = ProcessorConfig(
+            repo_root=self.temp_dir, batch_size=3, max_iterations=1
+        )
+        self.processor = ChecklistProcessor(config)
+        self.processor._generate_tier_reports = AsyncMock()
+        self.processor._process_item = self.fake_process_item
+        self.contexts = {}
+        self.runs = {}
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    async def fake_process_item(self, item, prefix_tier_map, mission_brief):
+        """API-001 completes, API-002 raises, API-0021 times out for a retry."""
+        processor = self.processor
+        run = processor.run_manager.create_run(item)
+        self.runs[item.id] = run
+        if item.id == "API-001":
+            ctx = self.contexts[item.id] = make_ctx(item_id=item.id)
+            output = await processor.update_status_stage.execute(ctx)
+            run.set_status(AgentStatus.COMPLETED)
+            queued = output.data["status_queued"]
+            return {"success": True, "run": run, "status_queued": queued}
+        if item.id == "API-002":
+            processor.parser.queue_status_update(item.id, "❌ Failed")
+            run.set_status(AgentStatus.FAILED, "agent crashed")
+            return {"success": False, "run": run, "error": "agent crashed"}
+        return {"success": False, "run": run, "error": "timeout_retry", "retry": True}
+
+    def statuses(self):
+        return {item.id: item.status for item in self.processor.parser.parse()}
+
+    @pytest.mark.asyncio
+    async def test_batch_statuses_written_in_one_rewrite(self, monkeypatch):
+        """Completed and failed rows should share the batch's single flush."""
+        parser = self.processor.parser
+        writes = []
+        write_atomically = parser.write_atomically
+
+        def record(path, content):
+            writes.append(path)
+            write_atomically(path, content)
+
+        monkeypatch.setattr(parser, "write_atomically", record)
+
+        result = await self.processor.process()
+
+        assert (result.completed, result.failed) == (1, 1)
+        assert writes == [self.checklist_path]
+        statuses = self.statuses()
+        assert statuses["API-001"] == "✅ Completed"
+        assert statuses["API-002"] == "❌ Failed"
+        assert statuses["API-0021"] == "☐ Not Started"
+        name, _ = self.contexts["API-001"].try_emit_event.call_args.args
+        assert name == "status.updated"
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_fails_only_queued_successes(self, monkeypatch):
+        """A failed flush should fail queued successes and leave other results."""
+
+        def fail(path, content):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.processor.parser, "write_atomically", fail)
+
+        result = await self.processor.process()
+
+        assert (result.completed, result.failed) == (0, 2)
+        assert self.runs["API-001"].status == AgentStatus.FAILED
+        assert self.runs["API-001"].error == "Checklist update failed: disk full"
+        assert self.runs["API-002"].error == "agent crashed"
+        assert self.runs["API-0021"].status != AgentStatus.FAILED
+        assert self.processor.parser._pending == {
+            "API-001": "✅ Completed",
+            "API-002": "❌ Failed",
+        }
+        name, _ = self.contexts["API-001"].try_emit_event.call_args.args
+        assert name == "status.update_failed"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,6 +6,7 @@ Single Responsibility: Only deals with checklist file I/O and parsing.
 
 import asyncio
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
@@ -13,6 +14,15 @@ from uuid import uuid4
 from ..models import ChecklistItem
 
 
+@lru_cache(maxsize=4096)
+def _status_cell_pattern(item_id: str) -> re.Pattern:
+    """Compiled pattern matching everything before an item row's Status cell."""
+    return re.compile(
+        rf"^([ \t]*\|[ \t]*{re.escape(item_id)}[ \t]*\|(?:[^|\n]*\|){{3}})[^|\n]*",
+        re.MULTILINE,
+    )
+
+
 class ChecklistParser:
     """
     Parser for checklist markdown files.
@@ -24,6 +34,8 @@ class ChecklistParser:
         self.checklist_path = Path(checklist_path)
         self.repo_root = Path(repo_root)
         self._file_locks: dict[str, asyncio.Lock] = {}
+        # Status updates queued for the next flush_pending() (item_id -> status)
+        self._pending: dict[str, str] = {}
     
     def _get_lock(self, path: Path) -> asyncio.Lock:
         """Get or create a lock for a file path."""
@@ -125,24 +137,43 @@ class ChecklistParser:
     
     async def update_item_status(self, item_id: str, new_status: str) -> None:
         """Update the status of an item in the checklist file."""
+        await self.update_item_status_batch([(item_id, new_status)])
+    
+    async def update_item_status_batch(self, updates: list[tuple[str, str]]) -> None:
+        """Update the status of several items with a single read and write."""
+        if not updates:
+            return
+        
+        statuses = dict(updates)
         lock = self._get_lock(self.checklist_path)
         
         async with lock:
             content = self.read_safe(self.checklist_path)
-            lines = content.split("\n")
+            for item_id, new_status in statuses.items():
+                # Rewrite the Status cell of the row whose ID column matches
+                content = _status_cell_pattern(item_id).sub(
+                    lambda m, status=new_status: f"{m.group(1)} {status} ", content
+                )
             
-            new_lines = []
-            for line in lines:
-                trimmed = line.strip()
-                # Match the item by ID in the table
-                if trimmed.startswith("|") and f" {item_id} " in line:
-                    parts = line.split("|")
-                    if len(parts) >= 6:
-                        parts[5] = f" {new_status} "
-                        line = "|".join(parts)
-                new_lines.append(line)
-            
-            self.write_atomically(self.checklist_path, "\n".join(new_lines))
+            self.write_atomically(self.checklist_path, content)
+    
+    def queue_status_update(self, item_id: str, new_status: str) -> None:
+        """Queue a status update to be written by the next flush_pending()."""
+        self._pending[item_id] = new_status
+    
+    async def flush_pending(self) -> int:
+        """Write all queued status updates in one pass. Returns the count written."""
+        if not self._pending:
+            return 0
+        
+        updates = list(self._pending.items())
+        await self.update_item_status_batch(updates)
+        # Drop only what was written: a failed write leaves every row queued
+        # for the next flush, and rows re-queued meanwhile keep their status
+        for item_id, status in updates:
+            if self._pending.get(item_id) == status:
+                del self._pending[item_id]
+        return len(updates)
     
     def build_prefix_tier_map(self, items: list[ChecklistItem]) -> dict[str, str]:
         """Build a mapping from ID prefix to tier name."""
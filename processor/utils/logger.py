@@ -4,11 +4,130 @@ Structured logging setup for the Checklist Processor.
 Provides clean, user-friendly logging with comprehensive status display.
 """
 
+import functools
+import json
 import logging
+import re
 import sys
-from datetime import datetime
+import threading
+import time
+import types
+from pathlib import Path
 from typing import Any
 
+# Fields pulled out of processor messages by _format_processor
+_RE_ITERATION = re.compile(r"iteration\s+(\d+)(?:\s*/\s*(\d+))?")
+_RE_STARTING = re.compile(r"Starting\s+(\S+)")
+_RE_PRIORITIZING = re.compile(r"Prioritizing\s+(\S+)")
+
+# Values of extra["event"] on processor records; CleanFormatter dispatches
+# on these and only falls back to matching message text when it is absent
+EVENT_ITERATION_STARTED = "iteration_started"
+EVENT_BATCH_STARTED = "batch_started"
+EVENT_ITEM_STARTED = "item_started"
+EVENT_ITEM_COMPLETED = "item_completed"
+EVENT_ITEM_FAILED = "item_failed"
+EVENT_BATCH_COMPLETE = "batch_complete"
+EVENT_PROCESSING_COMPLETE = "processing_complete"
+EVENT_ALL_COMPLETE = "all_complete"
+EVENT_MAX_ITERATIONS = "max_iterations"
+EVENT_PRIORITIZING = "prioritizing"
+EVENT_REQUEUED = "requeued"
+EVENT_DRY_RUN = "dry_run"
+
+
+def _processor_event(message: str, extra: dict) -> str | None:
+    """Classify a processor record that was logged without an event."""
+    if "Starting iteration" in message:
+        return EVENT_ITERATION_STARTED
+    if "Processing batch" in message:
+        return EVENT_BATCH_STARTED
+    if "Starting" in message and extra.get("tier"):
+        return EVENT_ITEM_STARTED
+    if "Completed" in message:
+        return EVENT_ITEM_COMPLETED
+    if "Failed" in message and extra.get("error_type"):
+        return EVENT_ITEM_FAILED
+    if "Batch" in message and "complete" in message:
+        return EVENT_BATCH_COMPLETE
+    if "Processing complete" in message:
+        return EVENT_PROCESSING_COMPLETE
+    if "All checklist items are complete" in message:
+        return EVENT_ALL_COMPLETE
+    if "Reached max iterations" in message:
+        return EVENT_MAX_ITERATIONS
+    if "Prioritizing" in message and "checkpoints" in message:
+        return EVENT_PRIORITIZING
+    if "Re-queued" in message:
+        return EVENT_REQUEUED
+    if "DRY RUN" in message:
+        return EVENT_DRY_RUN
+    return None
+
+
+# BufferedStreamHandler writes once this many records are pending...
+FLUSH_CAPACITY = 64
+# ...or this many seconds after the first record it held back
+FLUSH_INTERVAL = 0.5
+
+
+# Phase order for the status panel
+PHASE_ORDER = ("init", "research", "tests", "execution", "report")
+
+
+# Shared, read-only extra_data for records logged without context
+_EMPTY_EXTRA = types.MappingProxyType({})
+
+# Horizontal rule framing error blocks
+_RULE = "─" * 60
+
+# Pre-rendered _fmt_time() results for the common sub-minute case
+_SMALL = tuple("%ds" % i for i in range(60))
+
+
+def _fmt_time(seconds: int) -> str:
+    """Format seconds as Ns, M:SS or H:MM:SS."""
+    if 0 <= seconds < 60:
+        return _SMALL[seconds]
+    m, s = divmod(seconds, 60)
+    if m < 60:
+        return "%d:%02d" % (m, s)
+    h, m = divmod(m, 60)
+    return "%d:%02d:%02d" % (h, m, s)
+
+
+@functools.lru_cache(maxsize=256)
+def _stage_template(
+    completed: tuple[str, ...],
+    phase: str,
+    colors: tuple[str, str, str, str],
+) -> tuple[str, str | None]:
+    """
+    Render the status panel's stage line around the current phase's timer.
+
+    Returns (head, tail); the line is head + elapsed + tail, or just head
+    (tail is None) when the current phase is already complete. The timer is left out so
+    the cache key is only the (completed phases, current phase) state,
+    which changes a handful of times per item. colors is the formatter's
+    (green, yellow, dim, reset) escapes.
+    """
+    green, yellow, dim, reset = colors
+    stage_parts = []
+    for p in PHASE_ORDER:
+        if p in completed:
+            stage_parts.append(f"{green}{p}✓{reset}")
+        elif p == phase:
+            stage_parts.append(f"{yellow}{p}:\0{reset}")
+        else:
+            stage_parts.append(f"{dim}{p}{reset}")
+
+    # If current phase not in PHASE_ORDER, add it at the end
+    if phase not in PHASE_ORDER:
+        stage_parts.append(f"{yellow}{phase}:\0{reset}")
+
+    head, slot, tail = " → ".join(stage_parts).partition("\0")
+    return head, tail if slot else None
+
 
 class CleanFormatter(logging.Formatter):
     """Clean, user-friendly formatter for processor output."""
@@ -33,21 +152,59 @@ class CleanFormatter(logging.Formatter):
         logging.CRITICAL: "magenta",
     }
 
-    NOISY_LOGGERS = {
-        "stageflow",
-        "asyncio",
-        "httpx",
-        "httpcore",
-        "urllib3",
-    }
+    NOISY_LOGGERS = frozenset(
+        {
+            "stageflow",
+            "asyncio",
+            "httpx",
+            "httpcore",
+            "urllib3",
+        }
+    )
 
-    # Phase order for display
-    PHASE_ORDER = ["init", "research", "tests", "execution", "report"]
+    # Last rendered HH:MM:SS and the epoch second it belongs to
+    _ts_second: int = -1
+    _ts_str: str = ""
 
     def __init__(self, use_colors: bool = True, verbose: bool = False):
         super().__init__()
         self.use_colors = use_colors and sys.stdout.isatty()
         self.verbose = verbose
+        # Color escapes resolved once; each is "" when colors are off
+        colors = self.COLORS if self.use_colors else dict.fromkeys(self.COLORS, "")
+        self.c_dim = colors["dim"]
+        self.c_cyan = colors["cyan"]
+        self.c_green = colors["green"]
+        self.c_yellow = colors["yellow"]
+        self.c_red = colors["red"]
+        self.c_magenta = colors["magenta"]
+        self.c_bold = colors["bold"]
+        self.c_blue = colors["blue"]
+        self.c_reset = colors["reset"]
+        self._stage_colors = (self.c_green, self.c_yellow, self.c_dim, self.c_reset)
+        self._level_color_str = {
+            level: colors[name] for level, name in self.LEVEL_COLORS.items()
+        }
+        # Per-logger formatters; any other logger uses _format_default
+        self._dispatch = {
+            "processor": self._format_processor,
+            "run_agent": self._format_run_agent,
+            "checkpoint": self._format_checkpoint,
+        }
+        self._processor_events = {
+            EVENT_ITERATION_STARTED: self._on_iteration,
+            EVENT_BATCH_STARTED: self._on_silent,
+            EVENT_ITEM_STARTED: self._on_item_started,
+            EVENT_ITEM_COMPLETED: self._on_item_completed,
+            EVENT_ITEM_FAILED: self._on_item_failed,
+            EVENT_BATCH_COMPLETE: self._on_silent,
+            EVENT_PROCESSING_COMPLETE: self._on_processing_complete,
+            EVENT_ALL_COMPLETE: self._on_all_complete,
+            EVENT_MAX_ITERATIONS: self._on_max_iterations,
+            EVENT_PRIORITIZING: self._on_prioritizing,
+            EVENT_REQUEUED: self._on_silent,
+            EVENT_DRY_RUN: self._on_dry_run,
+        }
         # Track state across log messages
         self._state = {
             "iteration": 0,
@@ -61,23 +218,13 @@ class CleanFormatter(logging.Formatter):
             "current_item_start": None,
         }
 
-    def _color(self, name: str) -> str:
-        return self.COLORS.get(name, "") if self.use_colors else ""
-
-    def _reset(self) -> str:
-        return self.COLORS["reset"] if self.use_colors else ""
-
-    def _fmt_time(self, seconds: int) -> str:
-        """Format seconds as M:SS or H:MM:SS."""
-        if seconds < 60:
-            return f"{seconds}s"
-        elif seconds < 3600:
-            m, s = divmod(seconds, 60)
-            return f"{m}:{s:02d}"
-        else:
-            h, m = divmod(seconds // 60, 60)
-            s = seconds % 60
-            return f"{h}:{m:02d}:{s:02d}"
+    def _now_hms(self) -> str:
+        """Current local time as HH:MM:SS, rendered at most once per second."""
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._ts_str
 
     def _update_state(self, extra: dict) -> None:
         """Update tracked state from extra data."""
@@ -97,120 +244,98 @@ class CleanFormatter(logging.Formatter):
             self._state["session_start"] = extra["session_start"]
 
     def format(self, record: logging.LogRecord) -> str:
-        message = record.getMessage()
-        extra = getattr(record, "extra_data", {}) or {}
-        logger_name = record.name
+        # ContextRecord makes this a plain attribute load; records from any
+        # other factory fall back to the shared empty mapping
+        extra = getattr(record, "extra_data", _EMPTY_EXTRA)
 
         if record.levelno >= logging.ERROR:
-            return self._format_error(record, message, extra)
-
-        if logger_name == "processor":
-            return self._format_processor(record, message, extra)
-
-        if logger_name == "run_agent":
-            return self._format_run_agent(record, message, extra)
-
-        if logger_name == "observability":
-            return self._format_observability(record, message, extra)
+            return self._format_error(record, extra)
 
-        if logger_name == "checkpoint":
-            if record.levelno == logging.DEBUG and not self.verbose:
-                return ""
-            return self._format_checkpoint(record, message, extra)
+        # Noisy loggers and sub-WARNING levels are dropped by SuppressFilter.
+        # Handlers call record.getMessage() only when they need the text.
+        handler = self._dispatch.get(record.name, self._format_default)
+        return handler(record, extra)
 
-        if logger_name in self.NOISY_LOGGERS and not self.verbose:
-            return ""
-
-        if record.levelno == logging.DEBUG and not self.verbose:
-            return ""
-
-        if record.levelno == logging.INFO and logger_name not in (
-            "processor",
-            "run_agent",
-            "cli",
-        ):
-            if not self.verbose:
-                return ""
-
-        return self._format_default(record, message, extra)
-
-    def _format_processor(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
-        """Format processor logs."""
+    def _format_processor(self, record: logging.LogRecord, extra: dict) -> str:
+        """Format processor logs, keyed by their event."""
         self._update_state(extra)
 
-        if "Starting iteration" in message:
-            parts = message.split("iteration")[1].strip().split("/")
-            iteration = parts[0].strip()
-            max_iter = parts[1].strip() if len(parts) > 1 else "?"
-            self._state["iteration"] = int(iteration)
-            self._state["max_iterations"] = int(max_iter) if max_iter.isdigit() else 0
-            return ""
-
-        if "Processing batch" in message:
-            return ""
-
-        if "Starting" in message and extra.get("tier"):
-            item_id = message.split("Starting")[1].strip()
-            self._state["current_item"] = item_id
-            self._state["current_item_start"] = datetime.now()
-            return ""
-
-        if "Completed" in message:
-            self._state["completed_count"] += 1
-            return ""
+        event = extra.get("event") or _processor_event(record.getMessage(), extra)
+        handler = self._processor_events.get(event)
+        if handler is not None:
+            return handler(record, extra)
 
-        if "Failed" in message and extra.get("error_type"):
-            self._state["failed_count"] += 1
-            error_msg = (
-                message.split(":", 1)[1].strip() if ":" in message else "Unknown"
-            )
-            return f"\n{self._color('red')}✗ {error_msg}{self._reset()}"
+        if self.verbose:
+            return f"{self.c_dim}[{record.name}] {record.getMessage()}{self.c_reset}"
 
-        if "Batch" in message and "complete" in message:
-            return ""
+        return ""
 
-        if "Processing complete" in message:
-            processed = extra.get("processed", 0)
-            completed = extra.get("completed", 0)
-            failed = extra.get("failed", 0)
-            lines = [f"\n{self._color('bold')}━━━ Final Summary ━━━{self._reset()}"]
-            lines.append(
-                f"  {self._color('green')}✓ Completed: {completed}{self._reset()}"
-            )
-            if failed > 0:
-                lines.append(f"  {self._color('red')}✗ Failed: {failed}{self._reset()}")
-            lines.append(
-                f"  {self._color('dim')}Total processed: {processed}{self._reset()}"
-            )
-            return "\n".join(lines)
-
-        if "All checklist items are complete" in message:
-            return f"\n{self._color('green')}✓ All items complete!{self._reset()}"
-
-        if "Reached max iterations" in message:
-            return f"\n{self._color('yellow')}⚠ Reached max iterations{self._reset()}"
-
-        if "Prioritizing" in message and "checkpoints" in message:
-            count = message.split()[1]
-            return f"{self._color('yellow')}↻ Resuming {count} incomplete items{self._reset()}"
-
-        if "Re-queued" in message:
-            return ""
+    def _on_silent(self, record: logging.LogRecord, extra: dict) -> str:
+        """Events that only feed state or need no output."""
+        return ""
 
-        if "DRY RUN" in message:
-            return f"{self._color('cyan')}○ {message}{self._reset()}"
+    def _on_iteration(self, record: logging.LogRecord, extra: dict) -> str:
+        if "iteration" not in extra:
+            match = _RE_ITERATION.search(record.getMessage())
+            if match:
+                self._state["iteration"] = int(match.group(1))
+                self._state["max_iterations"] = int(match.group(2) or 0)
+        return ""
 
-        if self.verbose:
-            return f"{self._color('dim')}[{record.name}] {message}{self._reset()}"
+    def _on_item_started(self, record: logging.LogRecord, extra: dict) -> str:
+        item_id = extra.get("item_id")
+        if item_id is None:
+            match = _RE_STARTING.search(record.getMessage())
+            item_id = match.group(1) if match else None
+        self._state["current_item"] = item_id
+        self._state["current_item_start"] = time.monotonic()
+        return ""
 
+    def _on_item_completed(self, record: logging.LogRecord, extra: dict) -> str:
+        self._state["completed_count"] += 1
         return ""
 
-    def _format_run_agent(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
+    def _on_item_failed(self, record: logging.LogRecord, extra: dict) -> str:
+        self._state["failed_count"] += 1
+        error_msg = extra.get("error")
+        if error_msg is None:
+            _, sep, detail = record.getMessage().partition(":")
+            error_msg = detail.strip() if sep else "Unknown"
+        return f"\n{self.c_red}✗ {error_msg}{self.c_reset}"
+
+    def _on_processing_complete(self, record: logging.LogRecord, extra: dict) -> str:
+        processed = extra.get("processed", 0)
+        completed = extra.get("completed", 0)
+        failed = extra.get("failed", 0)
+        failed_line = ""
+        if failed > 0:
+            failed_line = f"  {self.c_red}✗ Failed: {failed}{self.c_reset}\n"
+        return (
+            f"\n{self.c_bold}━━━ Final Summary ━━━{self.c_reset}\n"
+            f"  {self.c_green}✓ Completed: {completed}{self.c_reset}\n"
+            f"{failed_line}"
+            f"  {self.c_dim}Total processed: {processed}{self.c_reset}"
+        )
+
+    def _on_all_complete(self, record: logging.LogRecord, extra: dict) -> str:
+        return f"\n{self.c_green}✓ All items complete!{self.c_reset}"
+
+    def _on_max_iterations(self, record: logging.LogRecord, extra: dict) -> str:
+        return f"\n{self.c_yellow}⚠ Reached max iterations{self.c_reset}"
+
+    def _on_prioritizing(self, record: logging.LogRecord, extra: dict) -> str:
+        count = extra.get("count")
+        if count is None:
+            match = _RE_PRIORITIZING.search(record.getMessage())
+            count = match.group(1) if match else "?"
+        return f"{self.c_yellow}↻ Resuming {count} incomplete items{self.c_reset}"
+
+    def _on_dry_run(self, record: logging.LogRecord, extra: dict) -> str:
+        return f"{self.c_cyan}○ {record.getMessage()}{self.c_reset}"
+
+    def _format_run_agent(self, record: logging.LogRecord, extra: dict) -> str:
         """Format run_agent logs with comprehensive status panel."""
+        message = record.getMessage()
 
         if "Progress:" in message:
             return self._format_status_panel(extra)
@@ -225,10 +350,10 @@ class CleanFormatter(logging.Formatter):
             return ""
 
         if "timed out" in message.lower():
-            return f"\n{self._color('yellow')}⏱ Timeout, retrying...{self._reset()}"
+            return f"\n{self.c_yellow}⏱ Timeout, retrying...{self.c_reset}"
 
         if self.verbose:
-            return f"{self._color('dim')}[run_agent] {message}{self._reset()}"
+            return f"{self.c_dim}[run_agent] {message}{self.c_reset}"
 
         return ""
 
@@ -246,58 +371,37 @@ class CleanFormatter(logging.Formatter):
         completed = self._state["completed_count"]
         failed = self._state["failed_count"]
 
-        # Stages line - compact format
-        stage_parts = []
-        for p in self.PHASE_ORDER:
-            if p in completed_phases:
-                stage_parts.append(f"{self._color('green')}{p}✓{self._reset()}")
-            elif p == phase:
-                stage_parts.append(
-                    f"{self._color('yellow')}{p}:{self._fmt_time(phase_sec)}{self._reset()}"
-                )
-            else:
-                stage_parts.append(f"{self._color('dim')}{p}{self._reset()}")
-
-        # If current phase not in PHASE_ORDER, add it at the end
-        if phase not in self.PHASE_ORDER:
-            stage_parts.append(
-                f"{self._color('yellow')}{phase}:{self._fmt_time(phase_sec)}{self._reset()}"
-            )
-
-        stages_line = " → ".join(stage_parts)
-
-        # Single compact line
-        status = f"{self._color('bold')}▶ {item_id}{self._reset()} "
-        status += f"{self._color('dim')}iter {iter_num}/{max_iter} │ {completed} done"
+        # Stages line - compact format, cached per phase state
+        head, tail = _stage_template(
+            tuple(completed_phases), phase, self._stage_colors
+        )
+        if tail is None:
+            stages_line = head
+        else:
+            stages_line = head + _fmt_time(phase_sec) + tail
+
+        # Single compact line, assembled with one join
+        parts = [
+            self.c_bold, "▶ ", str(item_id), self.c_reset, " ",
+            self.c_dim, "iter ", str(iter_num), "/", str(max_iter),
+            " │ ", str(completed), " done",
+        ]
         if failed > 0:
-            status += (
-                f" {self._color('red')}{failed} fail{self._reset()}{self._color('dim')}"
-            )
-        status += f" │ {self._fmt_time(elapsed)}{self._reset()}\n  {stages_line}"
-
-        return status
-
-    def _format_observability(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
-        """Format observability/stage logs."""
-        return ""  # Suppress these for cleaner output
-
-    def _format_checkpoint(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
+            parts += [" ", self.c_red, str(failed), " fail", self.c_reset, self.c_dim]
+        parts += [" │ ", _fmt_time(elapsed), self.c_reset, "\n  ", stages_line]
+
+        return "".join(parts)
+
+    def _format_checkpoint(self, record: logging.LogRecord, extra: dict) -> str:
         """Format checkpoint logs."""
         if self.verbose:
-            return f"{self._color('dim')}[checkpoint] {message}{self._reset()}"
+            return f"{self.c_dim}[checkpoint] {record.getMessage()}{self.c_reset}"
         return ""
 
-    def _format_error(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
+    def _format_error(self, record: logging.LogRecord, extra: dict) -> str:
         """Format error messages with clear visibility."""
-        lines = []
-        lines.append(f"\n{self._color('red')}{'─' * 60}{self._reset()}")
-        lines.append(f"{self._color('red')}✗ ERROR{self._reset()}")
+        rule = f"{self.c_red}{_RULE}{self.c_reset}"
+        lines = ["\n" + rule, f"{self.c_red}✗ ERROR{self.c_reset}"]
 
         if extra.get("item_id"):
             lines.append(f"  Item: {extra['item_id']}")
@@ -306,67 +410,262 @@ class CleanFormatter(logging.Formatter):
         if extra.get("stage"):
             lines.append(f"  Stage: {extra['stage']}")
 
-        error_type = extra.get("error_type", type(record).__name__)
-        lines.append(f"  {self._color('red')}{error_type}: {message}{self._reset()}")
+        error_type = extra.get("error_type") or (
+            record.exc_info[0].__name__ if record.exc_info else "Error"
+        )
+        lines.append(
+            f"  {self.c_red}{error_type}: {record.getMessage()}{self.c_reset}"
+        )
 
         if extra.get("exit_code"):
             lines.append(f"  Exit code: {extra['exit_code']}")
         if extra.get("log_path"):
             lines.append(f"  Log: {extra['log_path']}")
 
-        lines.append(f"{self._color('red')}{'─' * 60}{self._reset()}")
+        lines.append(rule)
 
         return "\n".join(lines)
 
-    def _format_default(
-        self, record: logging.LogRecord, message: str, extra: dict
-    ) -> str:
+    def _format_default(self, record: logging.LogRecord, extra: dict) -> str:
         """Format other logs with minimal noise."""
+        message = record.getMessage()
         level_name = record.levelname
-        color = self._color(self.LEVEL_COLORS.get(record.levelno, ""))
+        color = self._level_color_str.get(record.levelno, "")
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._now_hms()
 
         if record.levelno >= logging.WARNING:
-            return f"{color}[{timestamp}] {level_name}: {message}{self._reset()}"
+            return f"{color}[{timestamp}] {level_name}: {message}{self.c_reset}"
 
         if self.verbose:
-            return f"{self._color('dim')}[{timestamp}] [{record.name}] {message}{self._reset()}"
+            return f"{self.c_dim}[{timestamp}] [{record.name}] {message}{self.c_reset}"
 
         return ""
 
 
+class SuppressFilter(logging.Filter):
+    """
+    Drop records CleanFormatter would render as empty, before formatting.
+
+    Errors always pass. Observability records never do; CleanFormatter has
+    no view for them, stage progress shows in the status panel instead.
+    Outside verbose mode only processor/run_agent records (which feed the
+    formatter's state) and WARNING+ records from other non-noisy loggers
+    get through.
+    """
+
+    ALWAYS_SHOWN = ("processor", "run_agent")
+
+    # Loggers shown only in verbose mode, apart from errors
+    SUPPRESSED = CleanFormatter.NOISY_LOGGERS | {"checkpoint"}
+
+    def __init__(self, verbose: bool = False):
+        super().__init__()
+        self.verbose = verbose
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        name = record.name
+        if name == "observability":
+            return False
+        if self.verbose or name in self.ALWAYS_SHOWN:
+            return True
+        if name in self.SUPPRESSED:
+            return False
+        return record.levelno >= logging.WARNING
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    One compact JSON object per record, for the structured side file.
+
+    The message template and its args are stored unformatted alongside the
+    logger's context; values JSON can't represent are written with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "t": record.created,
+            "lvl": record.levelno,
+            "n": record.name,
+            "m": record.msg,
+            "a": record.args,
+        }
+        extra = getattr(record, "extra_data", None)
+        if extra:
+            # ContextLogger's context refers to itself under extra_data
+            entry["x"] = {k: v for k, v in extra.items() if k != "extra_data"}
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that coalesces formatted records into a single write.
+
+    Records are held until FLUSH_CAPACITY are pending, a WARNING+ record
+    arrives, or FLUSH_INTERVAL has passed since the first held record. One
+    daemon flusher thread, started with the first held record, serves the
+    interval for the handler's lifetime. On a terminal every record is
+    written straight away so progress stays live. Write errors go to
+    handleError() like StreamHandler's, and logging.shutdown() flushes
+    whatever is left at interpreter exit.
+
+    Held records are only in memory: if the process is killed outright,
+    up to FLUSH_INTERVAL seconds or FLUSH_CAPACITY - 1 INFO/DEBUG records
+    are lost. WARNING and above are never held.
+    """
+
+    def __init__(
+        self,
+        stream=None,
+        capacity: int = FLUSH_CAPACITY,
+        interval: float = FLUSH_INTERVAL,
+    ):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.interval = interval
+        self._buffer: list[str] = []
+        # Set while records are held; the flusher sleeps on it between batches
+        self._held = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: threading.Thread | None = None
+        isatty = getattr(self.stream, "isatty", None)
+        self._interactive = bool(isatty and isatty())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+            if (
+                self._interactive
+                or record.levelno >= logging.WARNING
+                or len(self._buffer) >= self.capacity
+            ):
+                self.flush()
+            elif not self._held.is_set():
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._run_flusher,
+                        name="BufferedStreamHandler-flusher",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+                self._held.set()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _run_flusher(self) -> None:
+        """Write held records interval seconds after they arrive, until close()."""
+        while not self._stopping.is_set():
+            self._held.wait()
+            if self._stopping.wait(self.interval):
+                return
+            try:
+                self.flush()
+            except (OSError, ValueError):
+                # A broken stream is ignored here, as logging.shutdown() does
+                pass
+
+    def flush(self) -> None:
+        with self.lock:
+            self._held.clear()
+            if self._buffer:
+                pending = "".join(self._buffer)
+                self._buffer.clear()
+                self.stream.write(pending)
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+
+    def close(self) -> None:
+        """Stop the flusher thread; records still held are written by flush()."""
+        self._stopping.set()
+        self._held.set()
+        super().close()
+
+
+class ContextRecord(logging.LogRecord):
+    """
+    LogRecord whose extra_data is always present.
+
+    The empty default lives on the class, so ContextLogger can still pass
+    extra_data through `extra` without makeRecord refusing to overwrite an
+    instance attribute. setup_logging installs this as the record factory
+    unless another library has already installed its own.
+    """
+
+    extra_data = _EMPTY_EXTRA
+
+
 class ContextLogger(logging.LoggerAdapter):
     """Logger adapter that adds context to all log messages."""
 
     def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:
-        extra = kwargs.get("extra", {})
+        extra = kwargs.get("extra")
         if self.extra:
+            if extra is None:
+                extra = kwargs["extra"] = {}
             extra.update(self.extra)
-        kwargs["extra"] = extra
 
         if extra:
-            kwargs.setdefault("extra", {})["extra_data"] = extra
+            extra["extra_data"] = extra
 
         return msg, kwargs
 
 
-def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
-    """Configure logging for the application."""
+def setup_logging(
+    verbose: bool = False,
+    quiet: bool = False,
+    structured_path: Path | None = None,
+) -> None:
+    """
+    Configure logging for the application.
+
+    With structured_path every record the root level admits, including
+    the loggers the console suppresses, is also appended to that file as
+    JSON lines. The console then keeps its non-verbose summary, so a
+    verbose trace goes to the file only.
+    """
     level = logging.DEBUG if verbose else logging.INFO
     if quiet:
         level = logging.WARNING
+    console_verbose = verbose and structured_path is None
+
+    handler = BufferedStreamHandler(sys.stdout)
+    handler.setFormatter(CleanFormatter(use_colors=True, verbose=console_verbose))
+    handler.addFilter(SuppressFilter(verbose=console_verbose))
+    handlers: list[logging.Handler] = [handler]
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(CleanFormatter(use_colors=True, verbose=verbose))
+    if structured_path is not None:
+        Path(structured_path).parent.mkdir(parents=True, exist_ok=True)
+        structured = logging.FileHandler(structured_path, mode="a", encoding="utf-8")
+        structured.setFormatter(StructuredFormatter())
+        handlers.append(structured)
+
+    if logging.getLogRecordFactory() is logging.LogRecord:
+        logging.setLogRecordFactory(ContextRecord)
 
     root = logging.getLogger()
     root.setLevel(level)
-    root.handlers = [handler]
-
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    for old in root.handlers:
+        old.flush()
+        if isinstance(old, (logging.FileHandler, BufferedStreamHandler)):
+            old.close()
+    root.handlers = handlers
+
+    # Loggers SuppressFilter would drop below ERROR never build records,
+    # unless the structured file wants them; the console filter still
+    # hides them there. Observability is dropped even in verbose mode
+    traced = structured_path is not None
+    suppressed = logging.NOTSET if verbose or traced else logging.ERROR
+    for name in SuppressFilter.SUPPRESSED:
+        logging.getLogger(name).setLevel(suppressed)
+    logging.getLogger("observability").setLevel(
+        logging.NOTSET if traced else logging.ERROR
+    )
 
 
 def get_logger(name: str, **context) -> ContextLogger:
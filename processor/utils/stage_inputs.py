@@ -0,0 +1,25 @@
+"""Helpers for reading prior stage outputs from stageflow StageInputs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stageflow.stages import StageInputs
+
+
+def get_many_from(
+    inputs: StageInputs,
+    stage_name: str,
+    keys: tuple[str, ...],
+    defaults: dict[str, Any] | None = None,
+) -> tuple[Any, ...]:
+    """Fetch several keys from one stage's output in a single lookup.
+
+    Equivalent to calling inputs.get_from(stage_name, key, default) per key,
+    but validates the dependency and resolves the output only once.
+    """
+    defaults = defaults or {}
+    output = inputs.get_output(stage_name)
+    data = output.data if output is not None else {}
+    return tuple(data.get(key, defaults.get(key)) for key in keys)